@@ -26,14 +26,16 @@ def analyze_different():
     different = []
 
     for key in common:
-        newer_data = newer.resources[key].data
-        older_data = older.resources[key].data
-        if newer_data != older_data:
+        newer_res = newer.resources[key]
+        older_res = older.resources[key]
+        if not newer_res.same_data(older_res):
+            newer_size = newer_res.size
+            older_size = older_res.size
             different.append({
                 'key': key,
-                'newer_size': len(newer_data),
-                'older_size': len(older_data),
-                'size_diff': len(older_data) - len(newer_data)
+                'newer_size': newer_size,
+                'older_size': older_size,
+                'size_diff': older_size - newer_size
             })
 
     print(f"\nAantal resources in beide maar VERSCHILLEND: {len(different)}")
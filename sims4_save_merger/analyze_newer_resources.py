@@ -23,14 +23,13 @@ def analyze():
     from_newer = []
 
     for key in merged.resources:
-        merged_data = merged.resources[key].data
         has_newer = key in newer.resources
         has_older = key in older.resources
 
-        if has_newer and newer.resources[key].data == merged_data:
+        if has_newer and newer.resources[key].same_data(merged.resources[key]):
             # This came from newer
-            newer_size = len(newer.resources[key].data)
-            older_size = len(older.resources[key].data) if has_older else 0
+            newer_size = newer.resources[key].size
+            older_size = older.resources[key].size if has_older else 0
 
             from_newer.append({
                 'key': key,
@@ -21,17 +21,17 @@ def analyze_saves():
 
     print(f"\n📁 NIEUWERE SAVE:")
     print(f"   Resources: {len(newer.resources)}")
-    total_newer = sum(len(r.data) for r in newer.resources.values())
+    total_newer = sum(r.size for r in newer.resources.values())
     print(f"   Totale data grootte: {total_newer:,} bytes ({total_newer/1024/1024:.2f} MB)")
 
     print(f"\n📁 OUDERE SAVE:")
     print(f"   Resources: {len(older.resources)}")
-    total_older = sum(len(r.data) for r in older.resources.values())
+    total_older = sum(r.size for r in older.resources.values())
     print(f"   Totale data grootte: {total_older:,} bytes ({total_older/1024/1024:.2f} MB)")
 
     print(f"\n📁 MERGED SAVE:")
     print(f"   Resources: {len(merged.resources)}")
-    total_merged = sum(len(r.data) for r in merged.resources.values())
+    total_merged = sum(r.size for r in merged.resources.values())
     print(f"   Totale data grootte: {total_merged:,} bytes ({total_merged/1024/1024:.2f} MB)")
 
     # Check what should have been added
@@ -44,7 +44,7 @@ def analyze_saves():
     print(f"   Resources alleen in oudere save: {len(only_older)}")
 
     # Calculate expected size from older-only resources
-    older_only_size = sum(len(older.resources[k].data) for k in only_older)
+    older_only_size = sum(older.resources[k].size for k in only_older)
     print(f"   Grootte van resources alleen in oudere: {older_only_size:,} bytes ({older_only_size/1024/1024:.2f} MB)")
 
     expected_total = total_newer + older_only_size
@@ -66,7 +66,7 @@ def analyze_saves():
     for key in list(newer_keys)[:50]:  # Check first 50
         if key in merged_keys:
             newer_in_merged += 1
-            if newer.resources[key].data == merged.resources[key].data:
+            if newer.resources[key].same_data(merged.resources[key]):
                 newer_data_matches += 1
 
     print(f"   Nieuwere resources in merged: {newer_in_merged}/50")
@@ -78,7 +78,7 @@ def analyze_saves():
     for key in list(only_older)[:50]:  # Check first 50
         if key in merged_keys:
             older_in_merged += 1
-            if older.resources[key].data == merged.resources[key].data:
+            if older.resources[key].same_data(merged.resources[key]):
                 older_data_matches += 1
 
     print(f"   Oudere-only resources in merged: {older_in_merged}/{min(50, len(only_older))}")
@@ -87,9 +87,9 @@ def analyze_saves():
     # Show size distribution
     print(f"\n📊 RESOURCE GROOTTE VERDELING:")
 
-    newer_sizes = sorted([len(r.data) for r in newer.resources.values()], reverse=True)
-    older_sizes = sorted([len(r.data) for r in older.resources.values()], reverse=True)
-    merged_sizes = sorted([len(r.data) for r in merged.resources.values()], reverse=True)
+    newer_sizes = sorted([r.size for r in newer.resources.values()], reverse=True)
+    older_sizes = sorted([r.size for r in older.resources.values()], reverse=True)
+    merged_sizes = sorted([r.size for r in merged.resources.values()], reverse=True)
 
     print(f"\n   NIEUWERE - Top 10 grootste resources:")
     for i, size in enumerate(newer_sizes[:10]):
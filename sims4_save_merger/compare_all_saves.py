@@ -30,7 +30,7 @@ def compare_all():
         try:
             loaded[name] = DBPFFile(Path(path))
             size = Path(path).stat().st_size
-            data_size = sum(len(r.data) for r in loaded[name].resources.values())
+            data_size = sum(r.size for r in loaded[name].resources.values())
             print(f"\n📁 {name}:")
             print(f"   Bestand: {size / 1024 / 1024:.2f} MB")
             print(f"   Resources: {len(loaded[name].resources)}")
@@ -61,8 +61,8 @@ def compare_all():
         # Check size differences for common resources
         smaller_in_corrupt = []
         for key in common:
-            c_size = len(corrupt.resources[key].data)
-            w_size = len(working.resources[key].data)
+            c_size = corrupt.resources[key].size
+            w_size = working.resources[key].size
             if c_size < w_size:
                 smaller_in_corrupt.append({
                     'key': key,
@@ -83,7 +83,7 @@ def compare_all():
             if type_id not in type_counts:
                 type_counts[type_id] = {'count': 0, 'size': 0}
             type_counts[type_id]['count'] += 1
-            type_counts[type_id]['size'] += len(working.resources[key].data)
+            type_counts[type_id]['size'] += working.resources[key].size
 
         for type_id, stats in sorted(type_counts.items(), key=lambda x: -x[1]['size']):
             print(f"      Type 0x{type_id:08X}: {stats['count']} resources, {stats['size']/1024:.1f} KB")
@@ -110,7 +110,7 @@ def compare_all():
         matches = 0
         differs = 0
         for key in common:
-            if our_merge.resources[key].data == working.resources[key].data:
+            if our_merge.resources[key].same_data(working.resources[key]):
                 matches += 1
             else:
                 differs += 1
@@ -127,7 +127,7 @@ def compare_all():
                 if type_id not in type_counts:
                     type_counts[type_id] = {'count': 0, 'size': 0}
                 type_counts[type_id]['count'] += 1
-                type_counts[type_id]['size'] += len(working.resources[key].data)
+                type_counts[type_id]['size'] += working.resources[key].size
 
             for type_id, stats in sorted(type_counts.items(), key=lambda x: -x[1]['size']):
                 print(f"      Type 0x{type_id:08X}: {stats['count']} resources, {stats['size']/1024:.1f} KB")
@@ -3,12 +3,20 @@
 Compare binary structure of working save vs our merge
 """
 
+import mmap
 import sys
 import struct
 sys.path.insert(0, '/home/user/De-Es-9b-Frans-kerst-2025')
 
 from pathlib import Path
 
+# Single little-endian uint32 (index flags, compressed size field)
+_U32 = struct.Struct('<I')
+# Header words from offset 36 up to and including offset 68
+_HEADER_WORDS = struct.Struct('<9I')
+# One uncompressed index entry: type, group, inst_hi, inst_lo, offset, file_size, mem_size
+_ENTRY = struct.Struct('<7I')
+
 def hexdump(data, length=128):
     result = []
     for i in range(0, min(len(data), length), 16):
@@ -23,31 +31,32 @@ def analyze_index(filepath, name):
     print(f"INDEX ANALYSE: {name}")
     print(f"{'='*70}")
 
-    with open(filepath, 'rb') as f:
-        data = f.read()
-
-    # Read header
-    index_offset = struct.unpack('<I', data[64:68])[0]
-    index_size = struct.unpack('<I', data[44:48])[0]
-    if index_size == 0:
-        index_size = struct.unpack('<I', data[68:72])[0]
-
-    entry_count = struct.unpack('<I', data[36:40])[0]
+    # Only the header and the start of the index are needed, so map the
+    # file instead of reading all of it
+    with open(filepath, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        # Read header (one unpack for all fields we need)
+        words = _HEADER_WORDS.unpack_from(data, 36)
+        entry_count = words[0]   # 36-40
+        index_size = words[2]    # 44-48
+        index_offset = words[7]  # 64-68
+        if index_size == 0:
+            index_size = words[8]  # 68-72
+
+        # Read index data
+        index_data = data[index_offset:index_offset + min(index_size, 512)]
 
     print(f"\nHeader info:")
     print(f"  Index offset: {index_offset}")
     print(f"  Index size: {index_size}")
     print(f"  Entry count: {entry_count}")
 
-    # Read index data
-    index_data = data[index_offset:index_offset + min(index_size, 512)]
-
     print(f"\nEerste 256 bytes van index:")
     print(hexdump(index_data, 256))
 
     # Parse index flags
     if len(index_data) >= 4:
-        flags = struct.unpack('<I', index_data[0:4])[0]
+        flags = _U32.unpack_from(index_data, 0)[0]
         print(f"\nIndex flags: 0x{flags:08X}")
         print(f"  Const type: {bool(flags & 1)}")
         print(f"  Const group: {bool(flags & 2)}")
@@ -58,13 +67,8 @@ def analyze_index(filepath, name):
     offset = 4
     try:
         # Assume no constant fields
-        type_id = struct.unpack('<I', index_data[offset:offset+4])[0]
-        group_id = struct.unpack('<I', index_data[offset+4:offset+8])[0]
-        inst_hi = struct.unpack('<I', index_data[offset+8:offset+12])[0]
-        inst_lo = struct.unpack('<I', index_data[offset+12:offset+16])[0]
-        res_offset = struct.unpack('<I', index_data[offset+16:offset+20])[0]
-        file_size = struct.unpack('<I', index_data[offset+20:offset+24])[0]
-        mem_size = struct.unpack('<I', index_data[offset+24:offset+28])[0]
+        (type_id, group_id, inst_hi, inst_lo,
+         res_offset, file_size, mem_size) = _ENTRY.unpack_from(index_data, offset)
 
         compressed = bool(file_size & 0x80000000)
         file_size_clean = file_size & 0x7FFFFFFF
@@ -78,7 +82,7 @@ def analyze_index(filepath, name):
 
         # Check if there's an extra field for compressed
         if compressed:
-            comp_size = struct.unpack('<I', index_data[offset+28:offset+32])[0]
+            comp_size = _U32.unpack_from(index_data, offset + 28)[0]
             print(f"  Compressed size field: {comp_size}")
 
     except Exception as e:
@@ -103,9 +107,14 @@ def main():
 
     # Byte-by-byte comparison
     print("\nVerschillen in eerste 64 bytes:")
-    for i in range(min(64, len(working_idx), len(merged_idx))):
-        if working_idx[i] != merged_idx[i]:
-            print(f"  Offset {i}: werkend=0x{working_idx[i]:02X}, merge=0x{merged_idx[i]:02X}")
+    n = min(64, len(working_idx), len(merged_idx))
+    diffs = [
+        f"  Offset {i}: werkend=0x{a:02X}, merge=0x{b:02X}"
+        for i, (a, b) in enumerate(zip(working_idx[:n], merged_idx[:n]))
+        if a != b
+    ]
+    if diffs:
+        print('\n'.join(diffs))
 
 if __name__ == '__main__':
     main()
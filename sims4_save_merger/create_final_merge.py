@@ -36,14 +36,14 @@ def create_merge():
     # Verify header
     print(f"\n🔍 Verificatie...")
     merged = DBPFFile(output)
-    working = DBPFFile(Path("sims4_save_merger/Slot_00000012.save"))
+    working = merger.older_file  # already parsed by load_files
 
     print(f"\n   Header vergelijking:")
     print(f"   Werkende - Index type: {working.header.index_type}")
     print(f"   Merged   - Index type: {merged.header.index_type}")
 
     print(f"\n   Bestandsgrootte: {output.stat().st_size / 1024 / 1024:.2f} MB")
-    print(f"   Data grootte: {sum(len(r.data) for r in merged.resources.values()) / 1024 / 1024:.2f} MB")
+    print(f"   Data grootte: {sum(r.size for r in merged.resources.values()) / 1024 / 1024:.2f} MB")
 
     # Check resource coverage
     working_keys = set(working.resources.keys())
@@ -69,7 +69,7 @@ def create_merge():
     print("=" * 70)
 
     merged = DBPFFile(output)
-    working = DBPFFile(Path("sims4_save_merger/Slot_00000012.save"))
+    working = merger.older_file  # already parsed by load_files
 
     # Check file sizes
     merged_size = output.stat().st_size
@@ -99,7 +99,7 @@ def create_merge():
     differs = 0
     for key in type6_working:
         if key in merged.resources:
-            if merged.resources[key].data == working.resources[key].data:
+            if merged.resources[key].same_data(working.resources[key]):
                 matches += 1
             else:
                 differs += 1
@@ -15,13 +15,42 @@ Each resource is identified by:
 - Instance ID (8 bytes)
 """
 
+import hashlib
+import os
 import struct
+import sys
 import zlib
+from array import array
+from itertools import chain
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional, BinaryIO
+from typing import Callable, List, Dict, Tuple, Optional, BinaryIO
 from pathlib import Path
 
 
+# Precompiled little-endian uint32 reader shared by the index parsers
+_U32 = struct.Struct('<I')
+
+# Fixed-size index entry: type, group, instance, offset, file_size,
+# mem_size and a trailing compressed field that is not used
+_FIXED_ENTRY = struct.Struct('<IIQIII4x')
+# Full (no constant fields) index entry: type, group, inst_hi, inst_lo,
+# offset, file_size, mem_size
+_INDEX_ENTRY = struct.Struct('<7I')
+# DBPF 2.0 header from the magic up to the index size at offset 68-72
+_HEADER = struct.Struct('<4s17I')
+
+# Write buffer size used when saving a file
+_WRITE_CHUNK = 1 << 20
+
+# array typecode for the uint32 index words. 'I' is only guaranteed to be
+# at least 2 bytes, so fall back to 'L'; save() checks the size it got.
+_U32_TYPECODE = 'I' if array('I').itemsize == 4 else 'L'
+
+# Leading bytes of compressed resource payloads
+_ZLIB_MAGICS = frozenset((b'\x78\x9C', b'\x78\xDA'))  # zlib
+_REFPACK_MAGICS = frozenset((b'\x10\xFB', b'\x90\xFB'))  # RefPack/QFS
+
+
 @dataclass
 class DBPFHeader:
     """DBPF file header structure"""
@@ -39,38 +68,40 @@ class DBPFHeader:
         if len(data) < 96:
             raise ValueError(f"Header te kort: {len(data)} bytes (minimaal 96 nodig)")
 
-        magic = data[0:4]
+        # One call reads the magic and every header word up to offset 72;
+        # words[n] is the uint32 at offset 4 + 4 * n
+        magic, *words = _HEADER.unpack_from(data, 0)
         if magic != b'DBPF':
             raise ValueError(f"Ongeldig DBPF bestand: magic bytes zijn {magic!r}, verwacht b'DBPF'")
 
-        major_version = struct.unpack('<I', data[4:8])[0]
-        minor_version = struct.unpack('<I', data[8:12])[0]
+        major_version = words[0]
+        minor_version = words[1]
 
         # Index type at offset 32
-        index_type = struct.unpack('<I', data[32:36])[0]
+        index_type = words[7]
 
         # Index entry count at offset 36
-        index_entry_count = struct.unpack('<I', data[36:40])[0]
+        index_entry_count = words[8]
 
         # Index information varies by version
         if major_version == 2:
             # DBPF 2.0 (Sims 4) - index offset at 64-68
-            index_offset = struct.unpack('<I', data[64:68])[0]
+            index_offset = words[15]
 
             # Index size can be at 68-72 OR 44-48 depending on the file
-            index_size = struct.unpack('<I', data[68:72])[0]
+            index_size = words[16]
 
             # If size is 0 at 68-72, use alternative location at 44-48
             if index_size == 0:
-                index_size = struct.unpack('<I', data[44:48])[0]
+                index_size = words[10]
 
             # If offset is 0, try alternative location at 40-44
             if index_offset == 0:
-                index_offset = struct.unpack('<I', data[40:44])[0]
+                index_offset = words[9]
         else:
             # DBPF 1.x format
-            index_offset = struct.unpack('<I', data[40:44])[0]
-            index_size = struct.unpack('<I', data[44:48])[0]
+            index_offset = words[9]
+            index_size = words[10]
 
         return cls(
             magic=magic,
@@ -104,6 +135,10 @@ class DBPFHeader:
 @dataclass
 class IndexEntry:
     """DBPF index entry - identifies a resource"""
+    # One of these exists per resource, so keep them free of a __dict__
+    __slots__ = ('type_id', 'group_id', 'instance_id', 'offset',
+                 'file_size', 'mem_size', 'compressed')
+
     type_id: int
     group_id: int
     instance_id: int
@@ -123,11 +158,85 @@ class IndexEntry:
         return f"{self.type_id:08X}:{self.group_id:08X}:{self.instance_id:016X}"
 
 
-@dataclass
 class Resource:
-    """A complete resource with index entry and data"""
-    entry: IndexEntry
-    data: bytes
+    """
+    A complete resource with index entry and data
+
+    The data can be passed in directly, or as the raw (possibly compressed)
+    bytes from the file. In the latter case decompression is deferred until
+    `data` is first accessed, so resources that are never read cost nothing
+    beyond the index entry.
+    """
+
+    __slots__ = ('entry', '_data', '_raw', '_owner', '_digest')
+
+    def __init__(
+        self,
+        entry: IndexEntry,
+        data: Optional[bytes] = None,
+        raw: Optional[memoryview] = None,
+        owner: Optional['DBPFFile'] = None
+    ):
+        self.entry = entry
+        self._data = data
+        self._raw = raw
+        self._owner = owner
+        self._digest = None
+
+    def __repr__(self) -> str:
+        return f"Resource(entry={self.entry!r}, loaded={self._data is not None})"
+
+    @property
+    def data(self) -> bytes:
+        """Resource data (uncompressed), loaded on first access"""
+        if self._data is None:
+            self._data = self._load()
+        return self._data
+
+    @data.setter
+    def data(self, value: bytes) -> None:
+        self._data = value
+        self._raw = None
+        self._digest = None
+
+    @property
+    def size(self) -> int:
+        """Length of `data`, read from the raw view when no decoding is needed"""
+        if self._data is None and self._raw is not None:
+            entry = self.entry
+            if not (entry.compressed and entry.file_size != entry.mem_size):
+                return len(self._raw)
+        return len(self.data)
+
+    @property
+    def digest(self) -> bytes:
+        """16-byte BLAKE2b digest of `data`, computed once and cached"""
+        if self._digest is None:
+            self._digest = hashlib.blake2b(self.data, digest_size=16).digest()
+        return self._digest
+
+    def same_data(self, other: 'Resource') -> bool:
+        """True if both resources hold the same data; sizes are checked first"""
+        return self.size == other.size and self.data == other.data
+
+    def _load(self) -> bytes:
+        """Decompress the raw file bytes this resource was created from"""
+        if self._raw is None:
+            return b''
+
+        raw_data = self._raw
+        self._raw = None
+
+        entry = self.entry
+        if entry.compressed and entry.file_size != entry.mem_size:
+            try:
+                # The decoders read straight from the file buffer view, so
+                # the compressed bytes are never copied out first
+                return self._owner._decompress(raw_data, entry.mem_size)
+            except Exception:
+                # Keep raw data if decompression fails
+                return bytes(raw_data)
+        return bytes(raw_data)
 
     @property
     def key(self) -> Tuple[int, int, int]:
@@ -137,6 +246,11 @@ class Resource:
     def key_hex(self) -> str:
         return self.entry.key_hex
 
+    @property
+    def offset(self) -> int:
+        """Offset of the resource data in the file it was read from"""
+        return self.entry.offset
+
 
 class DBPFFile:
     """
@@ -169,6 +283,34 @@ class DBPFFile:
         if filepath:
             self.load(filepath)
 
+    @classmethod
+    def from_entries(
+        cls,
+        header: DBPFHeader,
+        entries: List[IndexEntry],
+        payloads: List[bytes]
+    ) -> 'DBPFFile':
+        """
+        Build an in-memory file from index entries and their uncompressed data
+
+        Args:
+            header: Header for the new file
+            entries: Index entry of each resource
+            payloads: Data of each resource, in the same order as entries
+        """
+        dbpf = cls()
+        dbpf.header = header
+        dbpf.resources = {
+            entry.key: Resource(entry=entry, data=data)
+            for entry, data in zip(entries, payloads)
+        }
+        return dbpf
+
+    @property
+    def raw_header(self) -> bytes:
+        """The 96 header bytes as read from the file (empty if not loaded)"""
+        return self._raw_header
+
     def load(self, filepath: Path) -> None:
         """Load a DBPF file"""
         self.filepath = Path(filepath)
@@ -209,7 +351,9 @@ class DBPFFile:
         # Parse index entries
         entries = self._parse_index(index_data, self.header.index_entry_count)
 
-        # Read all resources
+        # Register all resources. The data is only sliced out of the file
+        # as a zero-copy view here; decompression happens on first access.
+        file_view = memoryview(file_data)
         for entry in entries:
             # Validate offset
             if entry.offset >= len(file_data):
@@ -217,29 +361,19 @@ class DBPFFile:
                 continue
 
             end_offset = min(entry.offset + entry.file_size, len(file_data))
-            raw_data = file_data[entry.offset:end_offset]
+            raw_data = file_view[entry.offset:end_offset]
 
             if len(raw_data) == 0:
                 continue
 
-            # Decompress if needed
-            if entry.compressed and entry.file_size != entry.mem_size:
-                try:
-                    data = self._decompress(raw_data, entry.mem_size)
-                except Exception:
-                    # Keep raw data if decompression fails
-                    data = raw_data
-            else:
-                data = raw_data
-
-            resource = Resource(entry=entry, data=data)
+            resource = Resource(entry=entry, raw=raw_data, owner=self)
             self.resources[resource.key] = resource
 
     def _safe_unpack(self, data: bytes, offset: int, size: int = 4) -> Tuple[int, int]:
         """Safely unpack an integer from data with bounds checking"""
         if offset + size > len(data):
             raise ValueError(f"Buffer te kort: nodig {offset + size} bytes, hebben {len(data)}")
-        value = struct.unpack('<I', data[offset:offset+size])[0]
+        value = _U32.unpack_from(data, offset)[0]
         return value, offset + size
 
     def _parse_index(self, data: bytes, count: int) -> List[IndexEntry]:
@@ -291,67 +425,69 @@ class DBPFFile:
         if const_instance_high:
             instance_high_const, offset = self._safe_unpack(data, offset)
 
+        # Every entry has the same layout: the non-constant key fields
+        # followed by instance_low, offset, file_size and mem_size.
+        # Compile that layout once instead of unpacking field by field.
+        entry_struct = struct.Struct(
+            '<%dI' % (7 - const_type - const_group - const_instance_high)
+        )
+        unpack_entry = entry_struct.unpack_from
+        entry_size = entry_struct.size
+        data_len = len(data)
+
         # Parse each entry
         for i in range(count):
-            try:
-                if const_type:
-                    type_id = type_id_const
-                else:
-                    type_id, offset = self._safe_unpack(data, offset)
-
-                if const_group:
-                    group_id = group_id_const
-                else:
-                    group_id, offset = self._safe_unpack(data, offset)
-
-                if const_instance_high:
-                    instance_high = instance_high_const
-                else:
-                    instance_high, offset = self._safe_unpack(data, offset)
-
-                instance_low, offset = self._safe_unpack(data, offset)
-                instance_id = (instance_high << 32) | instance_low
-
-                entry_offset, offset = self._safe_unpack(data, offset)
-                file_size_raw, offset = self._safe_unpack(data, offset)
-
-                # Check compression flag (high bit of file_size)
-                compressed = bool(file_size_raw & 0x80000000)
-                file_size = file_size_raw & 0x7FFFFFFF
-
-                mem_size, offset = self._safe_unpack(data, offset)
-
-                # Skip compressed size field if present
-                if compressed:
-                    _, offset = self._safe_unpack(data, offset)
-
-                entries.append(IndexEntry(
-                    type_id=type_id,
-                    group_id=group_id,
-                    instance_id=instance_id,
-                    offset=entry_offset,
-                    file_size=file_size,
-                    mem_size=mem_size,
-                    compressed=compressed
-                ))
-            except ValueError as e:
+            if offset + entry_size > data_len:
                 # Stop parsing if we run out of data
-                print(f"Waarschuwing: Kon entry {i+1}/{count} niet parsen: {e}")
+                print(f"Waarschuwing: Kon entry {i+1}/{count} niet parsen: "
+                      f"Buffer te kort: nodig {offset + entry_size} bytes, hebben {data_len}")
                 break
 
+            values = unpack_entry(data, offset)
+            offset += entry_size
+
+            key_fields = iter(values[:-4])
+            type_id = type_id_const if const_type else next(key_fields)
+            group_id = group_id_const if const_group else next(key_fields)
+            instance_high = instance_high_const if const_instance_high else next(key_fields)
+            instance_low, entry_offset, file_size_raw, mem_size = values[-4:]
+            instance_id = (instance_high << 32) | instance_low
+
+            # Check compression flag (high bit of file_size)
+            compressed = bool(file_size_raw & 0x80000000)
+            file_size = file_size_raw & 0x7FFFFFFF
+
+            # Skip compressed size field if present
+            if compressed:
+                if offset + 4 > data_len:
+                    print(f"Waarschuwing: Kon entry {i+1}/{count} niet parsen: "
+                          f"Buffer te kort: nodig {offset + 4} bytes, hebben {data_len}")
+                    break
+                offset += 4
+
+            entries.append(IndexEntry(
+                type_id=type_id,
+                group_id=group_id,
+                instance_id=instance_id,
+                offset=entry_offset,
+                file_size=file_size,
+                mem_size=mem_size,
+                compressed=compressed
+            ))
+
         return entries
 
     def _parse_index_fixed(self, data: bytes, count: int) -> List[IndexEntry]:
         """Parse fixed-size index entries (32 bytes each, no flags header)"""
         entries = []
-        entry_size = 32  # Type(4) + Group(4) + Instance(8) + Offset(4) + FileSize(4) + MemSize(4) + Compressed(4)
+        entry_size = _FIXED_ENTRY.size  # Type(4) + Group(4) + Instance(8) + Offset(4) + FileSize(4) + MemSize(4) + Compressed(4)
 
         # Check if we have flags header or direct entries
         # If data starts with reasonable entry values, assume no header
         offset = 0
 
         # Check if first 4 bytes look like flags (small number) or type ID (large hex)
-        first_val = struct.unpack('<I', data[0:4])[0]
+        first_val = _U32.unpack_from(data, 0)[0]
         if first_val < 8:  # Likely flags
             offset = 4
             flags = first_val
@@ -365,50 +501,32 @@ class DBPFFile:
         remaining = len(data) - offset
         actual_count = min(count, remaining // entry_size)
 
-        for i in range(actual_count):
-            try:
-                base = offset + (i * entry_size)
-
-                type_id = struct.unpack('<I', data[base:base+4])[0]
-                group_id = struct.unpack('<I', data[base+4:base+8])[0]
-                instance_id = struct.unpack('<Q', data[base+8:base+16])[0]
-                entry_offset = struct.unpack('<I', data[base+16:base+20])[0]
-
-                file_size_raw = struct.unpack('<I', data[base+20:base+24])[0]
-                compressed = bool(file_size_raw & 0x80000000)
-                file_size = file_size_raw & 0x7FFFFFFF
-
-                mem_size = struct.unpack('<I', data[base+24:base+28])[0]
-
-                entries.append(IndexEntry(
-                    type_id=type_id,
-                    group_id=group_id,
-                    instance_id=instance_id,
-                    offset=entry_offset,
-                    file_size=file_size,
-                    mem_size=mem_size,
-                    compressed=compressed
-                ))
-            except Exception as e:
-                print(f"Waarschuwing: Fout bij fixed entry {i}: {e}")
-                break
+        # actual_count is capped by the buffer, so the whole block can be
+        # decoded in one pass over a zero-copy view
+        block = memoryview(data)[offset:offset + actual_count * entry_size]
+        for (type_id, group_id, instance_id, entry_offset,
+             file_size_raw, mem_size) in _FIXED_ENTRY.iter_unpack(block):
+            entries.append(IndexEntry(
+                type_id=type_id,
+                group_id=group_id,
+                instance_id=instance_id,
+                offset=entry_offset,
+                file_size=file_size_raw & 0x7FFFFFFF,
+                mem_size=mem_size,
+                compressed=bool(file_size_raw & 0x80000000)
+            ))
 
         return entries
 
-    def _decompress(self, data: bytes, target_size: int) -> bytes:
-        """Decompress resource data"""
-        if len(data) < 2:
-            return data
-
-        # Check for zlib compression (common in Sims 4)
-        if data[0:2] == b'\x78\x9C' or data[0:2] == b'\x78\xDA':
+    def _decompress(self, data, target_size: int) -> bytes:
+        """Decompress resource data (bytes or a memoryview)"""
+        # One two-byte sniff picks the decoder
+        magic = bytes(data[:2])
+        if magic in _ZLIB_MAGICS:
             return zlib.decompress(data)
-
-        # Check for RefPack/QFS compression (EA proprietary)
-        if len(data) >= 5 and data[0:2] in [b'\x10\xFB', b'\x90\xFB']:
+        if magic in _REFPACK_MAGICS and len(data) >= 5:
             return self._decompress_refpack(data, target_size)
-
-        return data
+        return bytes(data)
 
     def _decompress_refpack(self, data: bytes, target_size: int) -> bytes:
         """Decompress RefPack/QFS compressed data"""
@@ -514,134 +632,155 @@ class DBPFFile:
             return compressed, True
         return data, False
 
-    def save(self, filepath: Path, compress_file: bool = False) -> None:
+    def save(
+        self,
+        filepath: Path,
+        compress_file: bool = False,
+        deduplicate: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> None:
         """
         Save the DBPF file
 
         Args:
             filepath: Output path
             compress_file: If True, compress the entire file with zlib
+            deduplicate: If True, resources with identical data share one
+                         copy in the file (their index entries point to the
+                         same offset)
+            progress: Optional function(done, total), called about 50 times
+                      while the resource data is being decoded
         """
         filepath = Path(filepath)
 
-        # Prepare all resources and build index
-        resource_data = bytearray()
-        entries = []
-
-        data_offset = 96  # Start after header
-
-        for key, resource in self.resources.items():
-            # Store data uncompressed for maximum compatibility
-            # Sims 4 can read uncompressed resources without issues
-            data_to_write = resource.data
-
-            entry = IndexEntry(
-                type_id=key[0],
-                group_id=key[1],
-                instance_id=key[2],
-                offset=data_offset,
-                file_size=len(data_to_write),
-                mem_size=len(data_to_write),
-                compressed=False
-            )
-            entries.append(entry)
-
-            resource_data.extend(data_to_write)
-            data_offset += len(data_to_write)
-
-        # Build index
-        index_data = self._build_index(entries)
+        # Store data uncompressed for maximum compatibility
+        # Sims 4 can read uncompressed resources without issues
+        resources = self.resources
+        if progress is None:
+            datas = [resource.data for resource in resources.values()]
+        else:
+            # Decoding the data is the slow part of saving; report it in
+            # steps rather than per resource
+            total = len(resources)
+            step = max(1, total // 50)
+            datas = []
+            for done, resource in enumerate(resources.values(), 1):
+                datas.append(resource.data)
+                if done % step == 0:
+                    progress(done, total)
+        sizes = [len(data) for data in datas]
+        entry_count = len(datas)
+
+        # Every size is known up front, so the header and index can be
+        # built before any data is written
+        index_size = 4 + _INDEX_ENTRY.size * entry_count
+
+        # Data offset of every resource; data starts after the header
+        offsets = []
+        data_offset = 96
+        if deduplicate:
+            # Resources are matched on their cached BLAKE2b digest; only the
+            # first copy of each payload is written
+            first_offsets = {}
+            unique_datas = []
+            for resource, data, size in zip(resources.values(), datas, sizes):
+                digest = resource.digest
+                offset = first_offsets.get(digest)
+                if offset is None:
+                    offset = first_offsets[digest] = data_offset
+                    unique_datas.append(data)
+                    data_offset += size
+                offsets.append(offset)
+            datas = unique_datas
+        else:
+            for size in sizes:
+                offsets.append(data_offset)
+                data_offset += size
         index_offset = data_offset
 
-        # Build complete DBPF 2.0 header (96 bytes)
+        # The index is collected as uint32 words and written as one block;
+        # it starts with a zero flags word (no constant fields)
+        index = array(_U32_TYPECODE, (0,))
+        if index.itemsize != 4:
+            # Any other word size would silently write a corrupt index
+            raise RuntimeError(f"Geen 4-byte array type op dit platform (itemsize {index.itemsize})")
+        add_entry = index.extend
+
+        for (type_id, group_id, instance_id), offset, size in zip(resources, offsets, sizes):
+            add_entry((type_id,
+                       group_id,
+                       instance_id >> 32,            # High
+                       instance_id & 0xFFFFFFFF,     # Low
+                       offset,
+                       size,                         # File size
+                       size))                        # Mem size
+
+        if sys.byteorder != 'little':
+            index.byteswap()
+
+        # DBPF 2.0 header (96 bytes); reserved bytes 72-95 stay 0
         header = bytearray(96)
+        _HEADER.pack_into(
+            header, 0,
+            b'DBPF',
+            2, 1,                 # Major/minor version
+            0, 0,                 # User version major/minor (can be 0)
+            0,                    # Unused/flags
+            0, 0,                 # Created/modified timestamps (0 = not set)
+            0,                    # Index type (0 for Sims 4 saves, 7 for packages)
+            entry_count,          # Index entry count
+            0,                    # Index location (offset 40-44 is usually 0 for DBPF 2.0)
+            index_size,           # Index size at offset 44 (alternative location)
+            0, 0, 0,              # Hole count/offset/size (usually 0)
+            3,                    # Index minor version
+            index_offset,         # Index offset and size (primary location for DBPF 2.0)
+            index_size,
+        )
 
-        # Magic and version
-        header[0:4] = b'DBPF'
-        struct.pack_into('<I', header, 4, 2)   # Major version
-        struct.pack_into('<I', header, 8, 1)   # Minor version
-
-        # User version (can be 0)
-        struct.pack_into('<I', header, 12, 0)  # User major
-        struct.pack_into('<I', header, 16, 0)  # User minor
-
-        # Unused/flags
-        struct.pack_into('<I', header, 20, 0)  # Flags
-
-        # Created/modified timestamps (0 = not set)
-        struct.pack_into('<I', header, 24, 0)  # Created
-        struct.pack_into('<I', header, 28, 0)  # Modified
-
-        # Index type (0 for Sims 4 saves, 7 for packages)
-        struct.pack_into('<I', header, 32, 0)
-
-        # Index entry count
-        struct.pack_into('<I', header, 36, len(entries))
-
-        # Index location (offset 40-44 is usually 0 for DBPF 2.0)
-        struct.pack_into('<I', header, 40, 0)
-
-        # Index size at offset 44 (alternative location)
-        struct.pack_into('<I', header, 44, len(index_data))
-
-        # Hole count/offset/size (usually 0)
-        struct.pack_into('<I', header, 48, 0)  # Hole count
-        struct.pack_into('<I', header, 52, 0)  # Hole offset
-        struct.pack_into('<I', header, 56, 0)  # Hole size
-
-        # Index minor version
-        struct.pack_into('<I', header, 60, 3)
-
-        # Index offset and size (primary location for DBPF 2.0)
-        struct.pack_into('<I', header, 64, index_offset)
-        struct.pack_into('<I', header, 68, len(index_data))
-
-        # Reserved bytes 72-95 are 0
-
-        # Combine all data
-        output_data = bytes(header) + bytes(resource_data) + bytes(index_data)
-
-        # Optionally compress entire file
-        if compress_file:
-            output_data = zlib.compress(output_data, 6)
-
-        # Write file
-        with open(filepath, 'wb') as f:
-            f.write(output_data)
-
-    def _build_index(self, entries: List[IndexEntry]) -> bytes:
-        """Build index data from entries"""
-        if not entries:
-            return struct.pack('<I', 0)  # Just flags
-
-        index = bytearray()
-
-        # Flags - no constant fields for simplicity
-        index.extend(struct.pack('<I', 0))
-
-        for entry in entries:
-            index.extend(struct.pack('<I', entry.type_id))
-            index.extend(struct.pack('<I', entry.group_id))
-            index.extend(struct.pack('<I', entry.instance_id >> 32))  # High
-            index.extend(struct.pack('<I', entry.instance_id & 0xFFFFFFFF))  # Low
-            index.extend(struct.pack('<I', entry.offset))
-
-            file_size = entry.file_size
-            if entry.compressed:
-                file_size |= 0x80000000
-            index.extend(struct.pack('<I', file_size))
-
-            index.extend(struct.pack('<I', entry.mem_size))
-
-            if entry.compressed:
-                index.extend(struct.pack('<I', entry.file_size))
-
-        return bytes(index)
+        # Stream header, data and index straight to the file instead of
+        # assembling a full copy of the output in memory; the file buffer
+        # coalesces the pieces into blocks of _WRITE_CHUNK bytes. Writing goes
+        # to a temporary sibling that only replaces filepath once complete,
+        # so a failed save never leaves a half-written file behind.
+        pieces = chain((header,), datas, (index,))
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb', buffering=_WRITE_CHUNK) as f:
+                if compress_file:
+                    # Optionally compress entire file
+                    compressor = zlib.compressobj(6)
+                    for piece in pieces:
+                        f.write(compressor.compress(piece))
+                    f.write(compressor.flush())
+                else:
+                    f.writelines(pieces)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
     def get_resource_type_name(self, type_id: int) -> str:
         """Get human-readable name for resource type"""
         return self.RESOURCE_TYPES.get(type_id, f"Type_{type_id:08X}")
 
+    def resources_by_type(self) -> Dict[int, Dict[Tuple[int, int, int], Resource]]:
+        """
+        Group resources by type ID in one pass
+
+        The grouping reflects `resources` at the time of the call; call it
+        again after adding or replacing resources.
+        """
+        groups: Dict[int, Dict[Tuple[int, int, int], Resource]] = {}
+        for key, resource in self.resources.items():
+            group = groups.get(key[0])
+            if group is None:
+                group = groups[key[0]] = {}
+            group[key] = resource
+        return groups
+
     def get_statistics(self) -> Dict:
         """Get file statistics"""
         type_counts = {}
@@ -650,7 +789,7 @@ class DBPFFile:
         for key, resource in self.resources.items():
             type_name = self.get_resource_type_name(key[0])
             type_counts[type_name] = type_counts.get(type_name, 0) + 1
-            total_size += len(resource.data)
+            total_size += resource.size
 
         return {
             'filepath': str(self.filepath) if self.filepath else None,
@@ -666,14 +805,19 @@ def compare_files(file1: DBPFFile, file2: DBPFFile) -> Dict:
     Compare two DBPF files and return differences
 
     Returns:
-        Dict with:
+        Dict of key sets (callers rely on set operations on them):
         - only_in_file1: keys only in first file
         - only_in_file2: keys only in second file
         - in_both: keys in both files
         - different: keys in both but with different data
     """
-    keys1 = set(file1.resources.keys())
-    keys2 = set(file2.resources.keys())
+    resources1 = file1.resources
+    resources2 = file2.resources
+
+    # Dict key views support set operations directly, so no intermediate
+    # copies of the (potentially large) key sets are needed
+    keys1 = resources1.keys()
+    keys2 = resources2.keys()
 
     only_in_1 = keys1 - keys2
     only_in_2 = keys2 - keys1
@@ -683,7 +827,7 @@ def compare_files(file1: DBPFFile, file2: DBPFFile) -> Dict:
     same = set()
 
     for key in in_both:
-        if file1.resources[key].data != file2.resources[key].data:
+        if not resources1[key].same_data(resources2[key]):
             different.add(key)
         else:
             same.add(key)
@@ -6,23 +6,55 @@ Usage:
     python debug_save.py <save_file>
 """
 
+import binascii
+import mmap
 import sys
 import struct
 import zlib
 from pathlib import Path
 
+# Bound little-endian uint32 reader: _U32(buffer, offset)[0]
+_U32 = struct.Struct('<I').unpack_from
+
+# Header words from byte 4 (major version) through byte 72 (index size)
+_HEADER_FIELDS = struct.Struct('<17I')
+
+# Second byte of a zlib stream header (first byte is always 0x78)
+_ZLIB_LEVEL_BYTES = frozenset((0x01, 0x5E, 0x9C, 0xDA))
+
+# Input chunk size when inflating zlib-compressed saves
+_INFLATE_CHUNK = 1 << 20
+
+# Byte translation table for the ASCII column: non-printables become '.'
+_PRINTABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
 
 def hexdump(data: bytes, length: int = 64) -> str:
     """Create a hex dump of data"""
     result = []
     for i in range(0, min(len(data), length), 16):
         chunk = data[i:i+16]
-        hex_part = ' '.join(f'{b:02X}' for b in chunk)
-        ascii_part = ''.join(chr(b) if 32 <= b < 127 else '.' for b in chunk)
+        hex_part = binascii.hexlify(chunk, ' ').decode('ascii').upper()
+        ascii_part = chunk.translate(_PRINTABLE).decode('latin-1')
         result.append(f'{i:08X}  {hex_part:<48}  {ascii_part}')
     return '\n'.join(result)
 
 
+def _inflate(data, chunk_size: int = _INFLATE_CHUNK) -> bytearray:
+    """
+    Decompress a zlib stream chunk by chunk into a single growing buffer,
+    so the compressed input never has to be copied into memory as a whole.
+    """
+    decompressor = zlib.decompressobj()
+    result = bytearray()
+    for pos in range(0, len(data), chunk_size):
+        result += decompressor.decompress(data[pos:pos + chunk_size])
+    result += decompressor.flush()
+    if not decompressor.eof:
+        raise zlib.error("incomplete or truncated stream")
+    return result
+
+
 def analyze_file(filepath: str):
     """Analyze a Sims 4 save file"""
     path = Path(filepath)
@@ -35,9 +67,19 @@ def analyze_file(filepath: str):
     print(f"ANALYSE: {path.name}")
     print(f"{'='*60}")
 
-    with open(path, 'rb') as f:
-        data = f.read()
+    # Map the file instead of reading it: only the header and the index
+    # region are touched, so the data section never has to be copied
+    if path.stat().st_size == 0:
+        _analyze_data(b'')
+        return
+
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        _analyze_data(data)
+
 
+def _analyze_data(data):
+    """Analyze the raw contents (bytes or mmap) of a save file"""
     print(f"\nBestandsgrootte: {len(data):,} bytes ({len(data)/1024/1024:.2f} MB)")
 
     # Check first bytes
@@ -45,19 +87,18 @@ def analyze_file(filepath: str):
 
     # Check if file is zlib compressed
     is_compressed = False
-    if data[0:2] in [b'\x78\x9C', b'\x78\xDA', b'\x78\x01', b'\x78\x5E']:
+    if len(data) >= 2 and data[0] == 0x78 and data[1] in _ZLIB_LEVEL_BYTES:
         print(f"\n*** Bestand is zlib gecomprimeerd ***")
         is_compressed = True
         try:
-            decompressed = zlib.decompress(data)
-            print(f"Gedecomprimeerde grootte: {len(decompressed):,} bytes")
-            data = decompressed
+            data = _inflate(data)
+            print(f"Gedecomprimeerde grootte: {len(data):,} bytes")
         except zlib.error as e:
             print(f"Kon niet decomprimeren: {e}")
             return
 
     # Check for DBPF magic
-    magic = data[0:4]
+    magic = bytes(data[0:4])
     print(f"\nMagic bytes: {magic} (verwacht: b'DBPF')")
 
     if magic != b'DBPF':
@@ -68,56 +109,48 @@ def analyze_file(filepath: str):
 
     print("\n*** Valide DBPF bestand gevonden ***")
 
-    # Parse header
-    major_version = struct.unpack('<I', data[4:8])[0]
-    minor_version = struct.unpack('<I', data[8:12])[0]
+    # Parse header - all fields from byte 4 up to 72 in one call
+    (major_version, minor_version,
+     user_major, user_minor, flags, created, modified,
+     index_type, index_count, index_loc, index_size_44,
+     _, _, _, _,
+     index_offset, index_size) = _HEADER_FIELDS.unpack_from(data, 4)
     print(f"\nDBPF Versie: {major_version}.{minor_version}")
 
     # Different header parsing based on version
     print("\n--- Header Details ---")
 
     # Bytes 12-16: User version major
-    user_major = struct.unpack('<I', data[12:16])[0]
     print(f"User Version Major: {user_major}")
 
     # Bytes 16-20: User version minor
-    user_minor = struct.unpack('<I', data[16:20])[0]
     print(f"User Version Minor: {user_minor}")
 
     # Bytes 20-24: Flags
-    flags = struct.unpack('<I', data[20:24])[0]
     print(f"Flags: {flags} (0x{flags:08X})")
 
     # Bytes 24-28: Created timestamp
-    created = struct.unpack('<I', data[24:28])[0]
     print(f"Created: {created}")
 
     # Bytes 28-32: Modified timestamp
-    modified = struct.unpack('<I', data[28:32])[0]
     print(f"Modified: {modified}")
 
     # Bytes 32-36: Index type
-    index_type = struct.unpack('<I', data[32:36])[0]
     print(f"Index Type: {index_type}")
 
     # Bytes 36-40: Index entry count
-    index_count = struct.unpack('<I', data[36:40])[0]
     print(f"Index Entry Count: {index_count}")
 
     # Bytes 40-44: Index location (offset)
-    index_loc = struct.unpack('<I', data[40:44])[0]
     print(f"Index Location (40-44): {index_loc}")
 
     # Bytes 44-48: Index size
-    index_size_44 = struct.unpack('<I', data[44:48])[0]
     print(f"Index Size (44-48): {index_size_44}")
 
     # Bytes 64-68: Index offset (primary for DBPF 2.0)
-    index_offset = struct.unpack('<I', data[64:68])[0]
     print(f"Index Offset (64-68): {index_offset}")
 
     # Bytes 68-72: Index size (primary for DBPF 2.0)
-    index_size = struct.unpack('<I', data[68:72])[0]
     print(f"Index Size (68-72): {index_size}")
 
     print(f"\n--- Index Analyse ---")
@@ -138,7 +171,7 @@ def analyze_file(filepath: str):
     print(f"\nIndex data grootte: {len(index_data)} bytes")
 
     if len(index_data) >= 4:
-        index_flags = struct.unpack('<I', index_data[0:4])[0]
+        index_flags = _U32(index_data, 0)[0]
         print(f"Index flags: {index_flags} (0x{index_flags:08X})")
         print(f"  Const Type: {bool(index_flags & 0x01)}")
         print(f"  Const Group: {bool(index_flags & 0x02)}")
@@ -189,51 +222,51 @@ def analyze_file(filepath: str):
         offset = 4  # Skip flags
 
         if const_type:
-            const_type_val = struct.unpack('<I', index_data[offset:offset+4])[0]
+            const_type_val = _U32(index_data, offset)[0]
             print(f"Const Type: 0x{const_type_val:08X}")
             offset += 4
 
         if const_group:
-            const_group_val = struct.unpack('<I', index_data[offset:offset+4])[0]
+            const_group_val = _U32(index_data, offset)[0]
             print(f"Const Group: 0x{const_group_val:08X}")
             offset += 4
 
         if const_inst_hi:
-            const_inst_hi_val = struct.unpack('<I', index_data[offset:offset+4])[0]
+            const_inst_hi_val = _U32(index_data, offset)[0]
             print(f"Const Instance High: 0x{const_inst_hi_val:08X}")
             offset += 4
 
         # First entry
         if not const_type:
-            type_id = struct.unpack('<I', index_data[offset:offset+4])[0]
+            type_id = _U32(index_data, offset)[0]
             print(f"Type ID: 0x{type_id:08X}")
             offset += 4
 
         if not const_group:
-            group_id = struct.unpack('<I', index_data[offset:offset+4])[0]
+            group_id = _U32(index_data, offset)[0]
             print(f"Group ID: 0x{group_id:08X}")
             offset += 4
 
         if not const_inst_hi:
-            inst_hi = struct.unpack('<I', index_data[offset:offset+4])[0]
+            inst_hi = _U32(index_data, offset)[0]
             print(f"Instance High: 0x{inst_hi:08X}")
             offset += 4
 
-        inst_lo = struct.unpack('<I', index_data[offset:offset+4])[0]
+        inst_lo = _U32(index_data, offset)[0]
         print(f"Instance Low: 0x{inst_lo:08X}")
         offset += 4
 
-        entry_offset = struct.unpack('<I', index_data[offset:offset+4])[0]
+        entry_offset = _U32(index_data, offset)[0]
         print(f"Entry Offset: {entry_offset}")
         offset += 4
 
-        file_size = struct.unpack('<I', index_data[offset:offset+4])[0]
+        file_size = _U32(index_data, offset)[0]
         compressed = bool(file_size & 0x80000000)
         file_size_clean = file_size & 0x7FFFFFFF
         print(f"File Size: {file_size_clean} (compressed: {compressed})")
         offset += 4
 
-        mem_size = struct.unpack('<I', index_data[offset:offset+4])[0]
+        mem_size = _U32(index_data, offset)[0]
         print(f"Mem Size: {mem_size}")
 
     except Exception as e:
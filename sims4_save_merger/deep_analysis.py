@@ -3,12 +3,31 @@
 Deep analysis of what's missing after the smart merge
 """
 
+import heapq
 import sys
+from operator import itemgetter
 sys.path.insert(0, '/home/user/De-Es-9b-Frans-kerst-2025')
 
 from sims4_save_merger.dbpf_parser import DBPFFile
 from pathlib import Path
 
+
+def summarize(dbpf):
+    """Count resources and total data size per type in one pass"""
+    counts = {}
+    sizes = {}
+    for key, resource in dbpf.resources.items():
+        type_id = key[0]
+        counts[type_id] = counts.get(type_id, 0) + 1
+        sizes[type_id] = sizes.get(type_id, 0) + resource.size
+    return counts, sizes
+
+
+def signatures(dbpf):
+    """Map every resource key to a 16-byte BLAKE2b digest of its data"""
+    return {key: resource.digest for key, resource in dbpf.resources.items()}
+
+
 def deep_analysis():
     print("=" * 70)
     print("DIEPE ANALYSE: WAT ONTBREEKT ER NOG?")
@@ -24,9 +43,9 @@ def deep_analysis():
     print(f"   Oudere save:   {Path('sims4_save_merger/Slot_00000012.save').stat().st_size / 1024 / 1024:.2f} MB")
     print(f"   Smart merged:  {Path('sims4_save_merger/Slot_00000002_smart_merged.save').stat().st_size / 1024 / 1024:.2f} MB")
 
-    newer_keys = set(newer.resources.keys())
-    older_keys = set(older.resources.keys())
-    merged_keys = set(merged.resources.keys())
+    newer_keys = newer.resources.keys()
+    older_keys = older.resources.keys()
+    merged_keys = merged.resources.keys()
 
     print(f"\n📊 Resource telling:")
     print(f"   Nieuwere: {len(newer_keys)}")
@@ -43,38 +62,40 @@ def deep_analysis():
         for key in missing_from_merged:
             type_id = key[0]
             type_counts[type_id] = type_counts.get(type_id, 0) + 1
-        for type_id, count in sorted(type_counts.items(), key=lambda x: -x[1]):
-            print(f"      Type 0x{type_id:08X}: {count}")
+        print('\n'.join(
+            f"      Type 0x{type_id:08X}: {count}"
+            for count, type_id in sorted(((c, t) for t, c in type_counts.items()), reverse=True)
+        ))
 
     # Check data sizes in merged vs older for resources that ARE in merged
     print(f"\n🔍 Data vergelijking (merged vs oudere save):")
 
-    # Resources that are in both merged and older
-    common_with_older = merged_keys & older_keys
-
+    # Walk merged once and look each key up in older, skipping keys
+    # that older doesn't have
+    older_resources = older.resources
     smaller_in_merged = []
-    for key in common_with_older:
-        merged_size = len(merged.resources[key].data)
-        older_size = len(older.resources[key].data)
+    for key, resource in merged.resources.items():
+        older_resource = older_resources.get(key)
+        if older_resource is None:
+            continue
+        merged_size = resource.size
+        older_size = older_resource.size
         if merged_size < older_size:
-            smaller_in_merged.append({
-                'key': key,
-                'merged_size': merged_size,
-                'older_size': older_size,
-                'diff': older_size - merged_size
-            })
+            smaller_in_merged.append((key, merged_size, older_size, older_size - merged_size))
 
     print(f"   Resources waar merged KLEINER is dan oudere: {len(smaller_in_merged)}")
 
     if smaller_in_merged:
-        smaller_in_merged.sort(key=lambda x: -x['diff'])
-        total_missing = sum(x['diff'] for x in smaller_in_merged)
+        total_missing = sum(diff for _, _, _, diff in smaller_in_merged)
         print(f"   Totaal ontbrekende data: {total_missing / 1024 / 1024:.2f} MB")
 
+        # Only the top 20 are shown, so don't sort the whole list
+        top_missing = heapq.nlargest(20, smaller_in_merged, key=itemgetter(3))
         print(f"\n   Top 20 grootste verschillen:")
-        for i, item in enumerate(smaller_in_merged[:20]):
-            type_id = item['key'][0]
-            print(f"      {i+1}. Type 0x{type_id:08X}: merged={item['merged_size']:>8} vs older={item['older_size']:>8} (mist {item['diff']/1024:.1f} KB)")
+        print('\n'.join(
+            f"      {i+1}. Type 0x{key[0]:08X}: merged={merged_size:>8} vs older={older_size:>8} (mist {diff/1024:.1f} KB)"
+            for i, (key, merged_size, older_size, diff) in enumerate(top_missing)
+        ))
 
     # Check which version was used in merged (newer or older)
     print(f"\n🔍 Bron analyse (waar komt merged data vandaan?):")
@@ -84,16 +105,20 @@ def deep_analysis():
     from_neither = 0
     modified = 0
 
-    for key in merged_keys:
-        merged_data = merged.resources[key].data
-        has_newer = key in newer_keys
-        has_older = key in older_keys
+    # Hash each resource once and compare digests instead of full data
+    newer_sigs = signatures(newer)
+    older_sigs = signatures(older)
+    merged_sigs = signatures(merged)
+
+    for key, merged_sig in merged_sigs.items():
+        newer_sig = newer_sigs.get(key)
+        older_sig = older_sigs.get(key)
 
-        if has_newer and newer.resources[key].data == merged_data:
+        if newer_sig == merged_sig:
             from_newer += 1
-        elif has_older and older.resources[key].data == merged_data:
+        elif older_sig == merged_sig:
             from_older += 1
-        elif has_newer or has_older:
+        elif newer_sig is not None or older_sig is not None:
             modified += 1  # Data is different from both
         else:
             from_neither += 1
@@ -106,27 +131,31 @@ def deep_analysis():
     # Analyze Type 0x00000006 specifically (lot data)
     print(f"\n🏠 Type 0x00000006 (Lot/Zone data) analyse:")
 
-    type6_newer = {k: v for k, v in newer.resources.items() if k[0] == 0x00000006}
-    type6_older = {k: v for k, v in older.resources.items() if k[0] == 0x00000006}
-    type6_merged = {k: v for k, v in merged.resources.items() if k[0] == 0x00000006}
+    newer_counts, newer_sizes = summarize(newer)
+    older_counts, older_sizes = summarize(older)
+    merged_counts, merged_sizes = summarize(merged)
 
-    print(f"   In nieuwere: {len(type6_newer)} resources, {sum(len(r.data) for r in type6_newer.values())/1024/1024:.2f} MB")
-    print(f"   In oudere:   {len(type6_older)} resources, {sum(len(r.data) for r in type6_older.values())/1024/1024:.2f} MB")
-    print(f"   In merged:   {len(type6_merged)} resources, {sum(len(r.data) for r in type6_merged.values())/1024/1024:.2f} MB")
+    lot_type = 0x00000006
+    print(f"   In nieuwere: {newer_counts.get(lot_type, 0)} resources, {newer_sizes.get(lot_type, 0)/1024/1024:.2f} MB")
+    print(f"   In oudere:   {older_counts.get(lot_type, 0)} resources, {older_sizes.get(lot_type, 0)/1024/1024:.2f} MB")
+    print(f"   In merged:   {merged_counts.get(lot_type, 0)} resources, {merged_sizes.get(lot_type, 0)/1024/1024:.2f} MB")
 
     # Check if merged type6 matches older
     type6_matches_older = 0
     type6_matches_newer = 0
     type6_smaller = 0
 
-    for key in type6_merged:
-        merged_data = type6_merged[key].data
-        if key in type6_older and type6_older[key].data == merged_data:
+    for key, resource in merged.resources.items():
+        if key[0] != lot_type:
+            continue
+
+        if older_sigs.get(key) == merged_sigs[key]:
             type6_matches_older += 1
-        elif key in type6_newer and type6_newer[key].data == merged_data:
+        elif newer_sigs.get(key) == merged_sigs[key]:
             type6_matches_newer += 1
 
-        if key in type6_older and len(merged_data) < len(type6_older[key].data):
+        older_resource = older_resources.get(key)
+        if older_resource is not None and resource.size < older_resource.size:
             type6_smaller += 1
 
     print(f"\n   Type 0x00000006 bronnen:")
@@ -136,17 +165,15 @@ def deep_analysis():
 
     # Show all unique resource types in older save
     print(f"\n📋 Alle resource types in oudere save:")
-    type_summary = {}
-    for key, resource in older.resources.items():
-        type_id = key[0]
-        if type_id not in type_summary:
-            type_summary[type_id] = {'count': 0, 'size': 0}
-        type_summary[type_id]['count'] += 1
-        type_summary[type_id]['size'] += len(resource.data)
-
-    for type_id, stats in sorted(type_summary.items(), key=lambda x: -x[1]['size']):
-        in_merged = sum(1 for k in merged_keys if k[0] == type_id)
-        print(f"   Type 0x{type_id:08X}: {stats['count']:4} resources, {stats['size']/1024/1024:>6.2f} MB | In merged: {in_merged}")
+    type_summary = [(size, older_counts[type_id], type_id)
+                    for type_id, size in older_sizes.items()]
+    type_summary.sort(reverse=True)
+
+    if type_summary:
+        print('\n'.join(
+            f"   Type 0x{type_id:08X}: {count:4} resources, {size/1024/1024:>6.2f} MB | In merged: {merged_counts.get(type_id, 0)}"
+            for size, count, type_id in type_summary
+        ))
 
     print("\n" + "=" * 70)
 
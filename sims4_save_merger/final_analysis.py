@@ -9,12 +9,21 @@ sys.path.insert(0, '/home/user/De-Es-9b-Frans-kerst-2025')
 from sims4_save_merger.dbpf_parser import DBPFFile
 from pathlib import Path
 import struct
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+
+# The 96-byte DBPF header as twelve little-endian 64-bit words
+_HEADER_QWORDS = struct.Struct('<12Q')
+
+# A resource that is smaller in the corrupt save than in the working one
+SizeDiff = namedtuple('SizeDiff', 'key corrupt_size working_size diff')
 
 def hexdump(data, length=64):
     result = []
     for i in range(0, min(len(data), length), 16):
         chunk = data[i:i+16]
-        hex_part = ' '.join(f'{b:02X}' for b in chunk)
+        hex_part = chunk.hex(' ').upper()
         result.append(f'{i:08X}  {hex_part:<48}')
     return '\n'.join(result)
 
@@ -23,10 +32,16 @@ def analyze():
     print("FINALE ANALYSE: WAAROM WERKT ONZE MERGE NIET?")
     print("=" * 80)
 
-    # Load files
-    working = DBPFFile(Path("sims4_save_merger/Slot_00000012.save"))
-    our_merge = DBPFFile(Path("sims4_save_merger/FINAL_MERGED.save"))
-    corrupt = DBPFFile(Path("sims4_save_merger/Slot_00000002.save"))
+    # Load files. The three parses are independent, and file reads (and
+    # zlib for compressed saves) release the GIL, so threads overlap them.
+    # DBPFFile holds views into its file buffer and can't be pickled, so
+    # a process pool is not an option.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        working, our_merge, corrupt = executor.map(DBPFFile, [
+            Path("sims4_save_merger/Slot_00000012.save"),
+            Path("sims4_save_merger/FINAL_MERGED.save"),
+            Path("sims4_save_merger/Slot_00000002.save"),
+        ])
 
     print(f"\n1. BESTANDSGROOTTES")
     print("-" * 40)
@@ -40,13 +55,37 @@ def analyze():
     print(f"   Merge:     {len(our_merge.resources)} resources")
     print(f"   Corrupt:   {len(corrupt.resources)} resources")
 
-    # Check if all working resources are in merge
-    working_keys = set(working.resources.keys())
-    merge_keys = set(our_merge.resources.keys())
-    corrupt_keys = set(corrupt.resources.keys())
+    # One sweep over the working save sorts every key into missing,
+    # identical or different, with the dict lookups bound to locals
+    working_res = working.resources
+    merge_res = our_merge.resources
+    merge_get = merge_res.get
+    corrupt_get = corrupt.resources.get
+
+    missing_from_merge = []
+    identical = 0
+    different = 0
+    diff_list = []
+
+    for key, work_resource in working_res.items():
+        merge_resource = merge_get(key)
+        if merge_resource is None:
+            missing_from_merge.append(key)
+            continue
+
+        if work_resource.same_data(merge_resource):
+            identical += 1
+        else:
+            different += 1
+            corrupt_resource = corrupt_get(key)
+            diff_list.append({
+                'key': key,
+                'work_size': work_resource.size,
+                'merge_size': merge_resource.size,
+                'from_corrupt': corrupt_resource is not None and corrupt_resource.same_data(merge_resource)
+            })
 
-    missing_from_merge = working_keys - merge_keys
-    extra_in_merge = merge_keys - working_keys
+    extra_in_merge = merge_res.keys() - working_res.keys()
 
     print(f"\n3. MISSING RESOURCES IN MERGE")
     print("-" * 40)
@@ -56,32 +95,12 @@ def analyze():
     if missing_from_merge:
         print(f"\n   ONTBREKENDE RESOURCES:")
         for key in sorted(missing_from_merge):
-            size = len(working.resources[key].data)
+            size = working_res[key].size
             print(f"      Type 0x{key[0]:08X}, Group 0x{key[1]:08X}, Inst 0x{key[2]:016X} - {size} bytes")
 
     # Check data content differences
     print(f"\n4. DATA VERSCHILLEN")
     print("-" * 40)
-    common_keys = working_keys & merge_keys
-    identical = 0
-    different = 0
-    diff_list = []
-
-    for key in common_keys:
-        work_data = working.resources[key].data
-        merge_data = our_merge.resources[key].data
-
-        if work_data == merge_data:
-            identical += 1
-        else:
-            different += 1
-            diff_list.append({
-                'key': key,
-                'work_size': len(work_data),
-                'merge_size': len(merge_data),
-                'from_corrupt': key in corrupt_keys and corrupt.resources[key].data == merge_data
-            })
-
     print(f"   Identieke resources: {identical}")
     print(f"   Verschillende resources: {different}")
 
@@ -114,10 +133,9 @@ def analyze():
     print(f"\n6. RAW HEADER BYTES")
     print("-" * 40)
 
-    with open("sims4_save_merger/Slot_00000012.save", 'rb') as f:
-        work_header = f.read(96)
-    with open("sims4_save_merger/FINAL_MERGED.save", 'rb') as f:
-        merge_header = f.read(96)
+    # Both files were read during parsing; reuse their header bytes
+    work_header = working.raw_header
+    merge_header = our_merge.raw_header
 
     print(f"\n   WERKENDE HEADER (eerste 48 bytes):")
     print(hexdump(work_header, 48))
@@ -127,15 +145,24 @@ def analyze():
 
     # Check byte differences
     print(f"\n   HEADER VERSCHILLEN:")
-    for i in range(96):
-        if work_header[i] != merge_header[i]:
-            print(f"      Byte {i}: werkend=0x{work_header[i]:02X}, merge=0x{merge_header[i]:02X}")
+    # Compare 8 bytes at a time and only look at single bytes inside
+    # words that differ
+    work_words = _HEADER_QWORDS.unpack(work_header)
+    merge_words = _HEADER_QWORDS.unpack(merge_header)
+    for word, (a, b) in enumerate(zip(work_words, merge_words)):
+        if a == b:
+            continue
+        xor = a ^ b
+        for k in range(8):
+            if (xor >> (8 * k)) & 0xFF:
+                i = word * 8 + k
+                print(f"      Byte {i}: werkend=0x{work_header[i]:02X}, merge=0x{merge_header[i]:02X}")
 
     # Compare total data sizes
     print(f"\n7. TOTALE DATA GROOTTE")
     print("-" * 40)
-    work_data_size = sum(len(r.data) for r in working.resources.values())
-    merge_data_size = sum(len(r.data) for r in our_merge.resources.values())
+    work_data_size = sum(r.size for r in working.resources.values())
+    merge_data_size = sum(r.size for r in our_merge.resources.values())
 
     print(f"   Werkende data: {work_data_size:,} bytes ({work_data_size/1024/1024:.2f} MB)")
     print(f"   Merge data:    {merge_data_size:,} bytes ({merge_data_size/1024/1024:.2f} MB)")
@@ -146,25 +173,21 @@ def analyze():
     print(f"\n8. RESOURCES WAAR CORRUPT KLEINER IS DAN WERKEND")
     print("-" * 40)
     corrupt_smaller = []
-    for key in corrupt_keys & working_keys:
-        c_size = len(corrupt.resources[key].data)
-        w_size = len(working.resources[key].data)
+    for key in corrupt.resources.keys() & working_res.keys():
+        c_size = corrupt.resources[key].size
+        w_size = working_res[key].size
         if c_size < w_size:
-            corrupt_smaller.append({
-                'key': key,
-                'corrupt_size': c_size,
-                'working_size': w_size,
-                'diff': w_size - c_size
-            })
+            corrupt_smaller.append(SizeDiff(key, c_size, w_size, w_size - c_size))
 
-    corrupt_smaller.sort(key=lambda x: -x['diff'])
-    total_missing = sum(x['diff'] for x in corrupt_smaller)
+    # Largest loss first; section 9 also walks the list in this order
+    corrupt_smaller.sort(key=attrgetter('diff'), reverse=True)
+    total_missing = sum(d.diff for d in corrupt_smaller)
     print(f"   Aantal resources: {len(corrupt_smaller)}")
     print(f"   Totaal ontbrekende data: {total_missing:,} bytes ({total_missing/1024/1024:.2f} MB)")
 
     print(f"\n   TOP 20 GROOTSTE VERSCHILLEN:")
     for d in corrupt_smaller[:20]:
-        print(f"      Type 0x{d['key'][0]:08X}: corrupt={d['corrupt_size']:>8}, werk={d['working_size']:>8} (-{d['diff']:,})")
+        print(f"      Type 0x{d.key[0]:08X}: corrupt={d.corrupt_size:>8}, werk={d.working_size:>8} (-{d.diff:,})")
 
     # Check if our merge uses the working data for these
     print(f"\n9. CHECK: GEBRUIKT ONZE MERGE DE WERKENDE DATA?")
@@ -174,18 +197,16 @@ def analyze():
     uses_neither = 0
 
     for d in corrupt_smaller:
-        key = d['key']
+        key = d.key
         if key not in our_merge.resources:
             print(f"   ONTBREEKT: Type 0x{key[0]:08X}")
             continue
 
-        merge_data = our_merge.resources[key].data
-        work_data = working.resources[key].data
-        corrupt_data = corrupt.resources[key].data
+        merge_resource = our_merge.resources[key]
 
-        if merge_data == work_data:
+        if merge_resource.same_data(working.resources[key]):
             uses_working += 1
-        elif merge_data == corrupt_data:
+        elif merge_resource.same_data(corrupt.resources[key]):
             uses_corrupt += 1
         else:
             uses_neither += 1
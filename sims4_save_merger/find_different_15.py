@@ -20,21 +20,21 @@ def find_different():
 
     different = []
     for key in set(our_merge.resources.keys()) & set(working.resources.keys()):
-        merge_data = our_merge.resources[key].data
-        work_data = working.resources[key].data
+        merge_resource = our_merge.resources[key]
+        work_resource = working.resources[key]
 
-        if merge_data != work_data:
+        if not merge_resource.same_data(work_resource):
             # Check where our merge data came from
             in_corrupt = key in corrupt.resources
-            matches_corrupt = in_corrupt and corrupt.resources[key].data == merge_data
+            matches_corrupt = in_corrupt and corrupt.resources[key].same_data(merge_resource)
 
             different.append({
                 'key': key,
                 'type_id': key[0],
-                'merge_size': len(merge_data),
-                'working_size': len(work_data),
+                'merge_size': merge_resource.size,
+                'working_size': work_resource.size,
                 'from_corrupt': matches_corrupt,
-                'diff': len(merge_data) - len(work_data)
+                'diff': merge_resource.size - work_resource.size
             })
 
     print(f"\nAantal verschillende resources: {len(different)}")
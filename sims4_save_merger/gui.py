@@ -8,12 +8,77 @@ Built with tkinter for cross-platform compatibility.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import threading
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-from .merger import Sims4SaveMerger, MergeResult, MergeStrategy
+from .merger import Sims4SaveMerger, MergeStrategy
+
+if TYPE_CHECKING:
+    from .merger import MergeResult
+
+
+# Interval (ms) at which progress updates from worker threads are shown
+PROGRESS_FLUSH_MS = 50
+
+# Maximum number of merge warnings listed in the result
+MAX_SHOWN_WARNINGS = 500
+
+# Section divider used in the analysis and merge reports
+DIVIDER = "=" * 60
+
+# Layout of the analysis report; the optional sections are filled in as
+# pre-joined blocks (empty when not applicable)
+ANALYSIS_TEMPLATE = """\
+{divider}
+ANALYSE RESULTAAT
+{divider}
+
+📁 NIEUWERE SAVE (basis):
+   Bestand: {newer_name}
+   Resources: {newer_count}
+   Grootte: {newer_mb:.2f} MB
+
+📁 OUDERE SAVE (bron):
+   Bestand: {older_name}
+   Resources: {older_count}
+   Grootte: {older_mb:.2f} MB
+
+{divider}
+VERGELIJKING
+{divider}
+
+✅ Identiek in beide:     {same}
+🔄 Verschillend:          {different}
+📌 Alleen in nieuwere:    {only_in_newer}
+📌 Alleen in oudere:      {only_in_older}
+
+{by_type_block}{smart_block}{divider}
+MERGE PREVIEW
+{divider}
+
+Het samengevoegde bestand zal bevatten:
+   • {total_new} resources van de nieuwere save
+   • {total_to_add} resources toegevoegd van de oudere save
+{replaced_line}   • {total_merged} resources totaal
+
+{verdict}"""
+
+SMART_MERGE_TEMPLATE = """\
+{divider}
+⚠️  SMART MERGE DETECTIE
+{divider}
+
+Gevonden: {count} resources die LEEG/CORRUPT
+lijken in de nieuwere save maar intact zijn in de oudere.
+
+Data die hersteld wordt: {restored_mb:.2f} MB
+
+Top 10 grootste herstelde resources:
+{top}
+"""
 
 
 class Sims4MergerGUI:
@@ -38,10 +103,34 @@ class Sims4MergerGUI:
         self.progress_var = tk.IntVar(value=0)
         self.status_var = tk.StringVar(value="Selecteer beide save bestanden om te beginnen")
 
+        # Path objects for the input fields, rebuilt only when a field changes
+        self._newer_path_obj: Optional[Path] = None
+        self._older_path_obj: Optional[Path] = None
+        self.newer_path.trace_add('write', self._invalidate_newer)
+        self.older_path.trace_add('write', self._invalidate_older)
+
         # Merger instance
         self.merger: Optional[Sims4SaveMerger] = None
         self.files_loaded = False
 
+        # One long-lived worker for analysis and merge, so both run off the
+        # Tk thread without starting a new thread per click
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="merger")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Traceback of the last failed analysis (without its frames); only
+        # formatted when the user asks for the details
+        self._last_error: Optional[traceback.TracebackException] = None
+
+        # Latest progress update from the worker thread, not yet shown;
+        # while it is set, a _flush_progress call is scheduled
+        self._pending_progress = None
+        self._progress_lock = threading.Lock()
+
+        # Last values written to the status/progress variables
+        self._last_status = None
+        self._last_percent = -1
+
         # Build UI
         self._create_widgets()
 
@@ -50,26 +139,20 @@ class Sims4MergerGUI:
 
     def _set_default_paths(self):
         """Set default path to Sims 4 saves folder"""
-        if os.name == 'nt':  # Windows
-            documents = Path.home() / "Documents"
-            sims4_saves = documents / "Electronic Arts" / "The Sims 4" / "saves"
-        else:  # Linux/Mac
-            documents = Path.home() / "Documents"
-            sims4_saves = documents / "Electronic Arts" / "The Sims 4" / "saves"
-
-        if sims4_saves.exists():
-            self.default_dir = str(sims4_saves)
+        # Same location on Windows, Linux and Mac; os.path keeps startup cheap
+        home = os.path.expanduser("~")
+        sims4_saves = os.path.join(home, "Documents", "Electronic Arts", "The Sims 4", "saves")
+
+        if os.path.isdir(sims4_saves):
+            self.default_dir = sims4_saves
         else:
-            self.default_dir = str(Path.home())
+            self.default_dir = home
 
     def _create_widgets(self):
         """Create all GUI widgets"""
         # Main container with padding
         main_frame = ttk.Frame(self.root, padding="15")
         main_frame.grid(row=0, column=0, sticky="nsew")
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(0, weight=1)
 
         # Title
         title_label = ttk.Label(
@@ -89,7 +172,6 @@ class Sims4MergerGUI:
         # File selection frame
         files_frame = ttk.LabelFrame(main_frame, text="Save Bestanden", padding="10")
         files_frame.grid(row=2, column=0, sticky="ew", pady=(0, 10))
-        files_frame.columnconfigure(1, weight=1)
 
         # Newer save file
         ttk.Label(files_frame, text="Nieuwere Save:", style='Header.TLabel').grid(
@@ -103,7 +185,6 @@ class Sims4MergerGUI:
 
         newer_frame = ttk.Frame(files_frame)
         newer_frame.grid(row=1, column=0, columnspan=3, sticky="ew", pady=(0, 10))
-        newer_frame.columnconfigure(0, weight=1)
 
         ttk.Entry(newer_frame, textvariable=self.newer_path).grid(
             row=0, column=0, sticky="ew", padx=(0, 5)
@@ -126,7 +207,6 @@ class Sims4MergerGUI:
 
         older_frame = ttk.Frame(files_frame)
         older_frame.grid(row=3, column=0, columnspan=3, sticky="ew", pady=(0, 10))
-        older_frame.columnconfigure(0, weight=1)
 
         ttk.Entry(older_frame, textvariable=self.older_path).grid(
             row=0, column=0, sticky="ew", padx=(0, 5)
@@ -149,7 +229,6 @@ class Sims4MergerGUI:
 
         output_frame = ttk.Frame(files_frame)
         output_frame.grid(row=5, column=0, columnspan=3, sticky="ew")
-        output_frame.columnconfigure(0, weight=1)
 
         ttk.Entry(output_frame, textvariable=self.output_path).grid(
             row=0, column=0, sticky="ew", padx=(0, 5)
@@ -170,16 +249,17 @@ class Sims4MergerGUI:
         # Info frame
         self.info_frame = ttk.LabelFrame(main_frame, text="Analyse Resultaat", padding="10")
         self.info_frame.grid(row=4, column=0, sticky="nsew", pady=(0, 10))
-        main_frame.rowconfigure(4, weight=1)
-        self.info_frame.columnconfigure(0, weight=1)
-        self.info_frame.rowconfigure(0, weight=1)
 
-        # Info text area
+        # Info text area (read-only; only changed through _insert_info)
         self.info_text = tk.Text(
             self.info_frame,
             height=12,
             wrap=tk.WORD,
-            font=('Consolas', 10)
+            font=('Consolas', 10),
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            state='disabled'
         )
         self.info_text.grid(row=0, column=0, sticky="nsew")
 
@@ -187,10 +267,18 @@ class Sims4MergerGUI:
         scrollbar.grid(row=0, column=1, sticky="ns")
         self.info_text.config(yscrollcommand=scrollbar.set)
 
+        # Shown only after a failed analysis
+        self.details_button = ttk.Button(
+            self.info_frame,
+            text="Foutdetails tonen...",
+            command=self._show_error_details
+        )
+        self.details_button.grid(row=1, column=0, sticky="e", pady=(5, 0))
+        self.details_button.grid_remove()
+
         # Progress frame
         progress_frame = ttk.Frame(main_frame)
         progress_frame.grid(row=5, column=0, sticky="ew", pady=(0, 10))
-        progress_frame.columnconfigure(0, weight=1)
 
         self.progress_bar = ttk.Progressbar(
             progress_frame,
@@ -226,6 +314,25 @@ Tip: Maak altijd een backup van je originele saves voordat je begint!
         help_label = ttk.Label(main_frame, text=help_text.strip(), style='Info.TLabel')
         help_label.grid(row=7, column=0, pady=(10, 0))
 
+        # Stretchable rows/columns, set up in one pass: (widget, axis, index)
+        for widget, axis, index in (
+            (self.root, 'column', 0),
+            (self.root, 'row', 0),
+            (main_frame, 'column', 0),
+            (main_frame, 'row', 4),
+            (files_frame, 'column', 1),
+            (newer_frame, 'column', 0),
+            (older_frame, 'column', 0),
+            (output_frame, 'column', 0),
+            (self.info_frame, 'column', 0),
+            (self.info_frame, 'row', 0),
+            (progress_frame, 'column', 0),
+        ):
+            if axis == 'row':
+                widget.rowconfigure(index, weight=1)
+            else:
+                widget.columnconfigure(index, weight=1)
+
     def _browse_newer(self):
         """Browse for newer save file"""
         path = filedialog.askopenfilename(
@@ -267,22 +374,62 @@ Tip: Maak altijd een backup van je originele saves voordat je begint!
         if path:
             self.output_path.set(path)
 
+    def _invalidate_newer(self, *args):
+        """Drop the cached newer save Path (StringVar trace callback)"""
+        self._newer_path_obj = None
+
+    def _invalidate_older(self, *args):
+        """Drop the cached older save Path (StringVar trace callback)"""
+        self._older_path_obj = None
+
+    def _get_newer_path(self) -> Path:
+        """Get the newer save path as a cached Path"""
+        if self._newer_path_obj is None:
+            self._newer_path_obj = Path(self.newer_path.get())
+        return self._newer_path_obj
+
+    def _get_older_path(self) -> Path:
+        """Get the older save path as a cached Path"""
+        if self._older_path_obj is None:
+            self._older_path_obj = Path(self.older_path.get())
+        return self._older_path_obj
+
     def _suggest_output_name(self):
         """Suggest an output filename based on input"""
         if self.newer_path.get() and not self.output_path.get():
-            newer = Path(self.newer_path.get())
+            newer = self._get_newer_path()
             suggested = newer.parent / f"{newer.stem}_merged.save"
             self.output_path.set(str(suggested))
 
     def _update_progress(self, message: str, percent: int):
         """Update progress bar and status (thread-safe)"""
-        self.root.after(0, lambda: self._do_update_progress(message, percent))
+        # Only keep the latest update; _flush_progress shows it on the main
+        # thread, so fast callbacks don't flood Tk with events. A flush is
+        # only scheduled when none is pending yet, so nothing runs while idle.
+        with self._progress_lock:
+            schedule = self._pending_progress is None
+            self._pending_progress = (message, percent)
+        if schedule:
+            self.root.after(PROGRESS_FLUSH_MS, self._flush_progress)
+
+    def _flush_progress(self):
+        """Show the latest pending progress update (runs on main thread)"""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+
+        if pending is not None:
+            self._do_update_progress(*pending)
 
     def _do_update_progress(self, message: str, percent: int):
         """Actually update the progress (runs on main thread)"""
-        self.status_var.set(message)
-        if percent >= 0:
+        # Setting a Tk variable repaints even if the value is the same
+        if message != self._last_status:
+            self.status_var.set(message)
+            self._last_status = message
+        if percent >= 0 and percent != self._last_percent:
             self.progress_var.set(percent)
+            self._last_percent = percent
 
     def _analyze_files(self):
         """Analyze the selected save files"""
@@ -293,46 +440,46 @@ Tip: Maak altijd een backup van je originele saves voordat je begint!
             )
             return
 
+        newer_path = self._get_newer_path()
+        older_path = self._get_older_path()
+
         # Verify files exist
-        if not Path(self.newer_path.get()).exists():
+        if not newer_path.exists():
             messagebox.showerror("Fout", "Nieuwere save bestand niet gevonden.")
             return
 
-        if not Path(self.older_path.get()).exists():
+        if not older_path.exists():
             messagebox.showerror("Fout", "Oudere save bestand niet gevonden.")
             return
 
-        self.merge_button.config(state='disabled')
-        self.info_text.delete(1.0, tk.END)
-        self.info_text.insert(tk.END, "Bestanden laden en analyseren...\n")
+        self.merge_button.state(['disabled'])
+        self._last_error = None
+        self.details_button.grid_remove()
+        self._insert_info("Bestanden laden en analyseren...\n", replace=True)
 
         # Run in thread
-        thread = threading.Thread(target=self._do_analysis)
-        thread.start()
+        self._executor.submit(self._do_analysis, newer_path, older_path)
 
-    def _do_analysis(self):
+    def _do_analysis(self, newer_path: Path, older_path: Path):
         """Perform the analysis (runs in thread)"""
         try:
             self.merger = Sims4SaveMerger(self._update_progress)
-            newer_stats, older_stats = self.merger.load_files(
-                Path(self.newer_path.get()),
-                Path(self.older_path.get())
-            )
+            newer_stats, older_stats = self.merger.load_files(newer_path, older_path)
 
             comparison = self.merger.get_comparison_summary()
-            mergeable = self.merger.get_mergeable_resources()
 
             # Get smart merge candidates (empty/corrupted resources in newer)
             smart_candidates = self.merger.get_smart_merge_candidates()
 
             # Format results
-            result = self._format_analysis(newer_stats, older_stats, comparison, mergeable, smart_candidates)
+            result = self._format_analysis(newer_stats, older_stats, comparison, smart_candidates)
 
             self.root.after(0, lambda: self._show_analysis_result(result, True))
 
         except Exception as e:
-            # Get detailed error information
-            error_details = traceback.format_exc()
+            # TracebackException drops the frames, which would otherwise
+            # keep the merger and both loaded saves alive
+            self._last_error = traceback.TracebackException(type(e), e, e.__traceback__)
             error_msg = f"""Fout bij analyseren: {str(e)}
 
 MOGELIJKE OORZAKEN:
@@ -340,107 +487,112 @@ MOGELIJKE OORZAKEN:
 2. Het bestand is beschadigd of incompleet
 3. Het bestand gebruikt een niet-ondersteund formaat
 
-DETAILS:
-{error_details}
+DETAILS: klik op "Foutdetails tonen..." voor de volledige foutmelding.
 
 TIP: Probeer de debug tool om meer informatie te krijgen:
-  python -m sims4_save_merger.debug_save "{self.newer_path.get()}"
+  python -m sims4_save_merger.debug_save "{newer_path}"
 """
             self.root.after(0, lambda: self._show_analysis_result(error_msg, False))
 
-    def _format_analysis(self, newer_stats, older_stats, comparison, mergeable, smart_candidates=None) -> str:
+    def _format_analysis(self, newer_stats, older_stats, comparison, smart_candidates=None) -> str:
         """Format the analysis results for display"""
-        lines = []
-        lines.append("=" * 60)
-        lines.append("ANALYSE RESULTAAT")
-        lines.append("=" * 60)
-        lines.append("")
-
-        lines.append("📁 NIEUWERE SAVE (basis):")
-        lines.append(f"   Bestand: {Path(newer_stats['filepath']).name}")
-        lines.append(f"   Resources: {newer_stats['resource_count']}")
-        lines.append(f"   Grootte: {newer_stats['total_size'] / 1024 / 1024:.2f} MB")
-        lines.append("")
-
-        lines.append("📁 OUDERE SAVE (bron):")
-        lines.append(f"   Bestand: {Path(older_stats['filepath']).name}")
-        lines.append(f"   Resources: {older_stats['resource_count']}")
-        lines.append(f"   Grootte: {older_stats['total_size'] / 1024 / 1024:.2f} MB")
-        lines.append("")
-
-        lines.append("=" * 60)
-        lines.append("VERGELIJKING")
-        lines.append("=" * 60)
-        lines.append("")
-
-        lines.append(f"✅ Identiek in beide:     {comparison['same']}")
-        lines.append(f"🔄 Verschillend:          {comparison['different']}")
-        lines.append(f"📌 Alleen in nieuwere:    {comparison['only_in_newer']}")
-        lines.append(f"📌 Alleen in oudere:      {comparison['only_in_older']}")
-        lines.append("")
-
-        if comparison['only_older_by_type']:
-            lines.append("Resources die toegevoegd kunnen worden (per type):")
-            for type_name, count in sorted(comparison['only_older_by_type'].items()):
-                lines.append(f"   • {type_name}: {count}")
-            lines.append("")
+        by_type_block = ""
+        only_older_by_type = comparison['only_older_by_type']
+        if only_older_by_type:
+            body = "\n".join(f"   • {t}: {c}" for t, c in sorted(only_older_by_type.items()))
+            by_type_block = f"Resources die toegevoegd kunnen worden (per type):\n{body}\n\n"
 
         # Show smart merge detection
+        smart_block = ""
+        replaced_line = ""
         if smart_candidates:
-            lines.append("=" * 60)
-            lines.append("⚠️  SMART MERGE DETECTIE")
-            lines.append("=" * 60)
-            lines.append("")
-            lines.append(f"Gevonden: {len(smart_candidates)} resources die LEEG/CORRUPT")
-            lines.append("lijken in de nieuwere save maar intact zijn in de oudere.")
-            lines.append("")
-
             # Calculate total size that would be restored
             total_restored = sum(old.size - new.size for new, old in smart_candidates)
-            lines.append(f"Data die hersteld wordt: {total_restored / 1024 / 1024:.2f} MB")
-            lines.append("")
-
-            lines.append("Top 10 grootste herstelde resources:")
-            for i, (new, old) in enumerate(smart_candidates[:10]):
-                diff = old.size - new.size
-                lines.append(f"   {i+1}. {new.type_name}: {new.size} → {old.size} bytes (+{diff/1024:.1f} KB)")
-            lines.append("")
-
-        lines.append("=" * 60)
-        lines.append("MERGE PREVIEW")
-        lines.append("=" * 60)
-        lines.append("")
+            top = "".join(
+                f"   {i+1}. {new.type_name}: {new.size} → {old.size} bytes (+{(old.size - new.size)/1024:.1f} KB)\n"
+                for i, (new, old) in enumerate(smart_candidates[:10])
+            )
+            smart_block = SMART_MERGE_TEMPLATE.format_map({
+                'divider': DIVIDER,
+                'count': len(smart_candidates),
+                'restored_mb': total_restored / 1024 / 1024,
+                'top': top,
+            })
+            replaced_line = f"   • {len(smart_candidates)} resources VERVANGEN door oudere versie (gebouwen)\n"
 
         total_new = newer_stats['resource_count']
         total_to_add = comparison['resources_to_add']
-        total_merged = total_new + total_to_add
-
-        lines.append(f"Het samengevoegde bestand zal bevatten:")
-        lines.append(f"   • {total_new} resources van de nieuwere save")
-        lines.append(f"   • {total_to_add} resources toegevoegd van de oudere save")
-        if smart_candidates:
-            lines.append(f"   • {len(smart_candidates)} resources VERVANGEN door oudere versie (gebouwen)")
-        lines.append(f"   • {total_merged} resources totaal")
-        lines.append("")
 
         if total_to_add > 0:
-            lines.append("✅ Klaar om samen te voegen!")
+            verdict = "✅ Klaar om samen te voegen!"
         else:
-            lines.append("ℹ️ Geen ontbrekende resources gevonden in de oudere save.")
-
-        return "\n".join(lines)
+            verdict = "ℹ️ Geen ontbrekende resources gevonden in de oudere save."
+
+        return ANALYSIS_TEMPLATE.format_map({
+            'divider': DIVIDER,
+            'newer_name': Path(newer_stats['filepath']).name,
+            'newer_count': newer_stats['resource_count'],
+            'newer_mb': newer_stats['total_size'] / 1024 / 1024,
+            'older_name': Path(older_stats['filepath']).name,
+            'older_count': older_stats['resource_count'],
+            'older_mb': older_stats['total_size'] / 1024 / 1024,
+            'same': comparison['same'],
+            'different': comparison['different'],
+            'only_in_newer': comparison['only_in_newer'],
+            'only_in_older': comparison['only_in_older'],
+            'by_type_block': by_type_block,
+            'smart_block': smart_block,
+            'total_new': total_new,
+            'total_to_add': total_to_add,
+            'replaced_line': replaced_line,
+            'total_merged': total_new + total_to_add,
+            'verdict': verdict,
+        })
+
+    def _insert_info(self, payload: str, replace: bool = False):
+        """Append a block to the info text in one go (or replace its contents)"""
+        # The widget is read-only; it is only writable during this insert
+        self.info_text.config(state='normal')
+        try:
+            if replace:
+                self.info_text.delete(1.0, tk.END)
+            self.info_text.insert(tk.END, payload)
+        finally:
+            self.info_text.config(state='disabled')
 
     def _show_analysis_result(self, result: str, success: bool):
         """Show analysis result in the info text area"""
-        self.info_text.delete(1.0, tk.END)
-        self.info_text.insert(tk.END, result)
+        self._insert_info(result, replace=True)
 
         if success:
             self.files_loaded = True
-            self.merge_button.config(state='normal')
+            self.merge_button.state(['!disabled'])
+            self._last_error = None
+            self.details_button.grid_remove()
         else:
             self.files_loaded = False
-            self.merge_button.config(state='disabled')
+            self.merge_button.state(['disabled'])
+            self.details_button.grid()
+
+    def _show_error_details(self):
+        """Show the full traceback of the last failed analysis"""
+        if self._last_error is None:
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title("Foutdetails")
+        window.geometry("700x400")
+        window.columnconfigure(0, weight=1)
+        window.rowconfigure(0, weight=1)
+
+        text = tk.Text(window, wrap=tk.NONE, font=('Consolas', 9))
+        text.grid(row=0, column=0, sticky="nsew")
+        scrollbar = ttk.Scrollbar(window, command=text.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        text.config(yscrollcommand=scrollbar.set)
+
+        text.insert(tk.END, "".join(self._last_error.format()))
+        text.config(state='disabled')
 
     def _start_merge(self):
         """Start the merge process"""
@@ -459,11 +611,10 @@ TIP: Probeer de debug tool om meer informatie te krijgen:
         ):
             return
 
-        self.merge_button.config(state='disabled')
+        self.merge_button.state(['disabled'])
 
         # Run in thread
-        thread = threading.Thread(target=self._do_merge)
-        thread.start()
+        self._executor.submit(self._do_merge)
 
     def _do_merge(self):
         """Perform the merge (runs in thread)"""
@@ -480,11 +631,11 @@ TIP: Probeer de debug tool om meer informatie te krijgen:
         except Exception as e:
             error_msg = f"Fout bij samenvoegen: {str(e)}"
             self.root.after(0, lambda: messagebox.showerror("Fout", error_msg))
-            self.root.after(0, lambda: self.merge_button.config(state='normal'))
+            self.root.after(0, lambda: self.merge_button.state(['!disabled']))
 
-    def _show_merge_result(self, result: MergeResult):
+    def _show_merge_result(self, result: "MergeResult"):
         """Show merge result"""
-        self.merge_button.config(state='normal')
+        self.merge_button.state(['!disabled'])
 
         if result.success:
             msg = f"""Samenvoegen succesvol!
@@ -498,22 +649,31 @@ TIP: Probeer de debug tool om meer informatie te krijgen:
 {result.output_file}
 """
             if result.warnings:
+                # Long warning lists would bloat the dialog and the Text widget
                 msg += "\n⚠️ Waarschuwingen:\n"
-                msg += "\n".join(f"• {w}" for w in result.warnings)
+                msg += "\n".join(f"• {w}" for w in result.warnings[:MAX_SHOWN_WARNINGS])
+                hidden = len(result.warnings) - MAX_SHOWN_WARNINGS
+                if hidden > 0:
+                    msg += f"\n… en {hidden} meer"
 
             messagebox.showinfo("Succes", msg)
 
-            # Update info text
-            self.info_text.insert(tk.END, "\n\n" + "=" * 60 + "\n")
-            self.info_text.insert(tk.END, "MERGE VOLTOOID\n")
-            self.info_text.insert(tk.END, "=" * 60 + "\n\n")
-            self.info_text.insert(tk.END, msg)
+            # Update info text in a single insert
+            self._insert_info("".join((
+                "\n\n", DIVIDER, "\nMERGE VOLTOOID\n", DIVIDER, "\n\n", msg
+            )))
+            self.info_text.see(tk.END)
 
         else:
             msg = "Samenvoegen mislukt.\n\nFouten:\n"
             msg += "\n".join(f"• {e}" for e in result.errors)
             messagebox.showerror("Fout", msg)
 
+    def _on_close(self):
+        """Close the window without waiting for a running job"""
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
+
     def run(self):
         """Start the GUI application"""
         self.root.mainloop()
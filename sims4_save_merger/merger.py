@@ -13,11 +13,16 @@ The merge strategy:
 """
 
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Callable
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional, Callable
 from dataclasses import dataclass
 from enum import Enum
-import shutil
-from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+import heapq
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from time import localtime, strftime
 
 from .dbpf_parser import DBPFFile, Resource, compare_files
 
@@ -35,6 +40,10 @@ class MergeStrategy(Enum):
 @dataclass
 class MergeResult:
     """Result of a merge operation"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ('success', 'output_file', 'resources_from_newer', 'resources_from_older',
+                 'resources_total', 'errors', 'warnings')
+
     success: bool
     output_file: Optional[Path]
     resources_from_newer: int
@@ -47,6 +56,8 @@ class MergeResult:
 @dataclass
 class ResourceInfo:
     """Information about a resource for display"""
+    __slots__ = ('key', 'key_hex', 'type_name', 'size', 'source')
+
     key: Tuple[int, int, int]
     key_hex: str
     type_name: str
@@ -68,7 +79,7 @@ class Sims4SaveMerger:
     """
 
     # Resource types that typically contain Sim-related data (use from newer)
-    SIM_RELATED_TYPES = {
+    SIM_RELATED_TYPES = frozenset({
         0xC0DB5AE7,  # SimInfo
         0xB61DE6B4,  # Household
         0x0C772E27,  # RelationshipData
@@ -77,19 +88,27 @@ class Sims4SaveMerger:
         0x0000000F,  # Game state data
         0x00000014,  # Achievement/progress data
         0x00000015,  # Skills/relationships data
-    }
+    })
 
     # Resource types that typically contain world/lot data (may need from older)
-    WORLD_RELATED_TYPES = {
+    WORLD_RELATED_TYPES = frozenset({
         0xE882D22F,  # Lot
         0xDC95CF1A,  # Zone
         0x62ECC59A,  # ObjectData
         0x00000006,  # Zone/Lot data (contains buildings!)
-    }
+    })
 
     # Minimum size threshold - if newer is smaller than this, likely corrupted/empty
     MIN_LOT_SIZE = 100  # bytes
 
+    # Builder method used by merge() for each strategy; strategies not
+    # listed use the plain newer base with missing resources added
+    _STRATEGY_HANDLERS = {
+        MergeStrategy.SMART_MERGE: '_build_smart_merge',
+        MergeStrategy.PREFER_LARGER: '_build_prefer_larger',
+        MergeStrategy.WORKING_BASE: '_build_working_base',
+    }
+
     def __init__(self, progress_callback: Optional[Callable[[str, int], None]] = None):
         """
         Initialize the merger
@@ -102,6 +121,13 @@ class Sims4SaveMerger:
         self.older_file: Optional[DBPFFile] = None
         self._comparison: Optional[Dict] = None
 
+        # Sizes of the differing resources, see _different_sizes
+        self._diff_sizes: Optional[Tuple[List[Tuple[int, int, int]], List[int], List[int]]] = None
+
+        # Memoized get_resource_type_name of each file, bound by load_files
+        self._new_type_name: Optional[Callable[[int], str]] = None
+        self._old_type_name: Optional[Callable[[int], str]] = None
+
     def _report_progress(self, message: str, percent: int = -1):
         """Report progress to callback if set"""
         if self.progress_callback:
@@ -118,14 +144,23 @@ class Sims4SaveMerger:
         Returns:
             Tuple of (newer_stats, older_stats)
         """
+        # Both parses are independent and their file reads release the GIL,
+        # so load them side by side. DBPFFile holds views into its file
+        # buffer and can't be pickled, which rules out a process pool.
         self._report_progress("Laden van nieuwere save...", 0)
-        self.newer_file = DBPFFile(newer_path)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            older_future = executor.submit(DBPFFile, older_path)
+            self.newer_file = DBPFFile(newer_path)
+            self._report_progress("Laden van oudere save...", 25)
+            self.older_file = older_future.result()
 
-        self._report_progress("Laden van oudere save...", 25)
-        self.older_file = DBPFFile(older_path)
+        # Only a few dozen type IDs occur, but names are asked for per key
+        self._new_type_name = lru_cache(maxsize=256)(self.newer_file.get_resource_type_name)
+        self._old_type_name = lru_cache(maxsize=256)(self.older_file.get_resource_type_name)
 
         self._report_progress("Vergelijken van bestanden...", 50)
         self._comparison = compare_files(self.newer_file, self.older_file)
+        self._diff_sizes = None
 
         self._report_progress("Analyse voltooid", 100)
 
@@ -134,6 +169,22 @@ class Sims4SaveMerger:
             self.older_file.get_statistics()
         )
 
+    def clone_for_strategy(self) -> 'Sims4SaveMerger':
+        """
+        Make a merger that shares this one's loaded files and comparison
+
+        merge() doesn't modify the loaded files, so the clone can merge with
+        another strategy without parsing and comparing the saves again.
+        """
+        clone = Sims4SaveMerger(self.progress_callback)
+        clone.newer_file = self.newer_file
+        clone.older_file = self.older_file
+        clone._comparison = self._comparison
+        clone._diff_sizes = self._diff_sizes
+        clone._new_type_name = self._new_type_name
+        clone._old_type_name = self._old_type_name
+        return clone
+
     def get_comparison_summary(self) -> Dict:
         """
         Get a summary of differences between the files
@@ -144,22 +195,18 @@ class Sims4SaveMerger:
         if not self._comparison:
             raise ValueError("Files not loaded. Call load_files first.")
 
-        # Count by type
-        only_newer_types = {}
-        only_older_types = {}
-        different_types = {}
-
-        for key in self._comparison['only_in_file1']:
-            type_name = self.newer_file.get_resource_type_name(key[0])
-            only_newer_types[type_name] = only_newer_types.get(type_name, 0) + 1
+        # Count by type. Counter tallies the type IDs in C; there are only a
+        # few dozen distinct IDs, so each name is then resolved just once.
+        def count_types(keys, get_type_name: Callable[[int], str]) -> Dict[str, int]:
+            counts: Dict[str, int] = {}
+            for type_id, count in Counter(key[0] for key in keys).items():
+                type_name = get_type_name(type_id)
+                counts[type_name] = counts.get(type_name, 0) + count
+            return counts
 
-        for key in self._comparison['only_in_file2']:
-            type_name = self.older_file.get_resource_type_name(key[0])
-            only_older_types[type_name] = only_older_types.get(type_name, 0) + 1
-
-        for key in self._comparison['different']:
-            type_name = self.newer_file.get_resource_type_name(key[0])
-            different_types[type_name] = different_types.get(type_name, 0) + 1
+        only_newer_types = count_types(self._comparison['only_in_file1'], self._new_type_name)
+        only_older_types = count_types(self._comparison['only_in_file2'], self._old_type_name)
+        different_types = count_types(self.iter_conflict_keys(), self._new_type_name)
 
         return {
             'only_in_newer': len(self._comparison['only_in_file1']),
@@ -172,30 +219,69 @@ class Sims4SaveMerger:
             'resources_to_add': len(self._comparison['only_in_file2']),
         }
 
-    def get_mergeable_resources(self) -> List[ResourceInfo]:
+    def iter_mergeable_resources(self) -> Iterator[ResourceInfo]:
         """
-        Get list of resources that could be added from the older save
+        Iterate over resources that could be added from the older save
 
-        Returns:
-            List of ResourceInfo for resources only in older save
+        Unlike get_mergeable_resources, this builds each ResourceInfo on
+        demand and does not sort.
+
+        Yields:
+            ResourceInfo for each resource only in older save
         """
         if not self._comparison:
             raise ValueError("Files not loaded. Call load_files first.")
 
-        resources = []
+        older_resources = self.older_file.resources
+        type_name = self._old_type_name
 
         # Resources only in older save (can be added)
         for key in self._comparison['only_in_file2']:
-            resource = self.older_file.resources[key]
-            resources.append(ResourceInfo(
+            resource = older_resources[key]
+            yield ResourceInfo(
                 key=key,
                 key_hex=resource.key_hex,
-                type_name=self.older_file.get_resource_type_name(key[0]),
-                size=len(resource.data),
+                type_name=type_name(key[0]),
+                size=resource.size,
                 source='older'
-            ))
+            )
 
-        return sorted(resources, key=lambda r: (r.type_name, r.key))
+    def get_mergeable_resources(self, top_k: Optional[int] = None) -> List[ResourceInfo]:
+        """
+        Get list of resources that could be added from the older save
+
+        Args:
+            top_k: If set, only return the first top_k resources of the
+                   sorted list, without sorting all of them
+
+        Returns:
+            List of ResourceInfo for resources only in older save
+        """
+        order = attrgetter('type_name', 'key')
+        if top_k is not None:
+            return heapq.nsmallest(top_k, self.iter_mergeable_resources(), key=order)
+        return sorted(self.iter_mergeable_resources(), key=order)
+
+    def _different_sizes(self) -> Tuple[List[Tuple[int, int, int]], List[int], List[int]]:
+        """
+        Get the differing keys with their newer and older sizes
+
+        Built once per load as three parallel lists, so the strategy checks
+        don't look both resources up again for every key.
+
+        Returns:
+            Tuple of (keys, newer_sizes, older_sizes)
+        """
+        if self._diff_sizes is None:
+            keys = list(self.iter_conflict_keys())
+            newer_resources = self.newer_file.resources
+            older_resources = self.older_file.resources
+            self._diff_sizes = (
+                keys,
+                [newer_resources[key].size for key in keys],
+                [older_resources[key].size for key in keys],
+            )
+        return self._diff_sizes
 
     def _detect_empty_resources(self) -> Set[Tuple[int, int, int]]:
         """
@@ -209,13 +295,9 @@ class Sims4SaveMerger:
         if not self._comparison:
             return empty_resources
 
-        for key in self._comparison['different']:
-            newer_resource = self.newer_file.resources[key]
-            older_resource = self.older_file.resources[key]
-
-            newer_size = len(newer_resource.data)
-            older_size = len(older_resource.data)
+        world_types = self.WORLD_RELATED_TYPES
 
+        for key, newer_size, older_size in zip(*self._different_sizes()):
             # Check if this is a world/lot resource type
             type_id = key[0]
 
@@ -230,7 +312,7 @@ class Sims4SaveMerger:
                     empty_resources.add(key)
 
             # For other world-related types, use similar logic
-            elif type_id in self.WORLD_RELATED_TYPES:
+            elif type_id in world_types:
                 if newer_size < 100 and older_size > newer_size * 5:
                     empty_resources.add(key)
 
@@ -247,19 +329,14 @@ class Sims4SaveMerger:
         Returns:
             Set of keys where older version is larger
         """
-        larger = set()
-
         if not self._comparison:
-            return larger
-
-        for key in self._comparison['different']:
-            newer_size = len(self.newer_file.resources[key].data)
-            older_size = len(self.older_file.resources[key].data)
-
-            if older_size > newer_size:
-                larger.add(key)
+            return set()
 
-        return larger
+        return {
+            key
+            for key, newer_size, older_size in zip(*self._different_sizes())
+            if older_size > newer_size
+        }
 
     def get_smart_merge_candidates(self) -> List[Tuple[ResourceInfo, ResourceInfo]]:
         """
@@ -269,61 +346,106 @@ class Sims4SaveMerger:
             List of (newer_info, older_info) tuples for resources that appear empty
         """
         candidates = []
+        deltas = []
         empty_keys = self._detect_empty_resources()
+        newer_resources = self.newer_file.resources
+        older_resources = self.older_file.resources
+        type_name_of = self._new_type_name
 
         for key in empty_keys:
-            newer_resource = self.newer_file.resources[key]
-            older_resource = self.older_file.resources[key]
+            newer_resource = newer_resources[key]
+            older_resource = older_resources[key]
+            type_name = type_name_of(key[0])
 
             newer_info = ResourceInfo(
                 key=key,
                 key_hex=newer_resource.key_hex,
-                type_name=self.newer_file.get_resource_type_name(key[0]),
-                size=len(newer_resource.data),
+                type_name=type_name,
+                size=newer_resource.size,
                 source='newer'
             )
 
             older_info = ResourceInfo(
                 key=key,
                 key_hex=older_resource.key_hex,
-                type_name=self.older_file.get_resource_type_name(key[0]),
-                size=len(older_resource.data),
+                type_name=type_name,
+                size=older_resource.size,
                 source='older'
             )
 
             candidates.append((newer_info, older_info))
+            deltas.append(older_info.size - newer_info.size)
 
-        return sorted(candidates, key=lambda x: x[1].size - x[0].size, reverse=True)
+        # Largest size gain first; sorting indices on the plain int deltas
+        # keeps the key function in C (ties stay in their original order)
+        order = sorted(range(len(candidates)), key=deltas.__getitem__, reverse=True)
+        return [candidates[i] for i in order]
+
+    def iter_conflict_keys(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Get an iterator over the keys of resources that differ between the files
 
-    def get_conflicting_resources(self) -> List[Tuple[ResourceInfo, ResourceInfo]]:
+        Use this instead of get_conflicting_resources when only the keys are
+        needed; no ResourceInfo objects are built.
+
+        Returns:
+            Iterator over the keys of resources that exist in both files but
+            are different
+        """
+        if not self._comparison:
+            raise ValueError("Files not loaded. Call load_files first.")
+
+        return iter(self._comparison['different'])
+
+    def get_conflicting_resources(
+        self,
+        keys: Optional[Iterable[Tuple[int, int, int]]] = None
+    ) -> List[Tuple[ResourceInfo, ResourceInfo]]:
         """
         Get list of resources that exist in both files but are different
 
+        Args:
+            keys: If set, only build entries for these conflicting keys
+                  If None, build entries for all conflicts
+
         Returns:
             List of (newer_info, older_info) tuples
         """
         if not self._comparison:
             raise ValueError("Files not loaded. Call load_files first.")
 
+        different = self._comparison['different']
+        if keys is None:
+            keys = different
+        else:
+            keys = [key for key in keys if key in different]
+
         conflicts = []
+        newer_resources = self.newer_file.resources
+        older_resources = self.older_file.resources
+        type_name_of = self._new_type_name
 
-        for key in self._comparison['different']:
-            newer_resource = self.newer_file.resources[key]
-            older_resource = self.older_file.resources[key]
+        for key in keys:
+            newer_resource = newer_resources[key]
+            older_resource = older_resources[key]
+
+            # Type names don't depend on the file, so resolve it once for both.
+            # Resource.size avoids decompressing the data just to measure it.
+            type_name = type_name_of(key[0])
 
             newer_info = ResourceInfo(
                 key=key,
                 key_hex=newer_resource.key_hex,
-                type_name=self.newer_file.get_resource_type_name(key[0]),
-                size=len(newer_resource.data),
+                type_name=type_name,
+                size=newer_resource.size,
                 source='newer'
             )
 
             older_info = ResourceInfo(
                 key=key,
                 key_hex=older_resource.key_hex,
-                type_name=self.older_file.get_resource_type_name(key[0]),
-                size=len(older_resource.data),
+                type_name=type_name,
+                size=older_resource.size,
                 source='older'
             )
 
@@ -360,13 +482,17 @@ class Sims4SaveMerger:
         warnings = []
         output_path = Path(output_path)
 
-        # Create backup if needed
+        # Create backup if needed. The existing output is linked aside (not
+        # copied) when the merged file is written, see _save_merged. A free
+        # name is picked so an earlier backup from the same second is kept.
+        backup_path = None
         if create_backup and output_path.exists():
-            backup_path = output_path.with_suffix(
-                f'.backup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.save'
-            )
-            shutil.copy2(output_path, backup_path)
-            warnings.append(f"Backup gemaakt: {backup_path}")
+            stamp = strftime("%Y%m%d_%H%M%S", localtime())
+            backup_path = output_path.with_suffix(f'.backup_{stamp}.save')
+            n = 1
+            while backup_path.exists():
+                backup_path = output_path.with_suffix(f'.backup_{stamp}_{n}.save')
+                n += 1
 
         self._report_progress("Samenvoegen van bestanden...", 0)
 
@@ -374,78 +500,23 @@ class Sims4SaveMerger:
         merged = DBPFFile()
         merged.header = self.newer_file.header
 
-        # Start with all resources from newer save
-        resources_from_newer_count = 0
-        resources_from_older_count = 0
-
         self._report_progress("Kopieren van nieuwere save resources...", 10)
 
-        # Determine which resources should come from older save
-        use_older_keys = set()
-
-        if strategy == MergeStrategy.SMART_MERGE:
-            # Smart merge: detect empty/corrupted resources
-            use_older_keys = self._detect_empty_resources()
-            if use_older_keys:
-                warnings.append(f"Smart merge: {len(use_older_keys)} resources worden uit oudere save genomen (lege/corrupte detectie)")
-
-        elif strategy == MergeStrategy.PREFER_LARGER:
-            # Prefer larger: use older whenever it's bigger
-            use_older_keys = self._get_larger_resources()
-            if use_older_keys:
-                warnings.append(f"Prefer larger: {len(use_older_keys)} resources worden uit oudere save genomen (grotere versie)")
-
-        elif strategy == MergeStrategy.WORKING_BASE:
-            # WORKING_BASE: Use older (working) save as the base
-            # Only update sim-related resources from newer (corrupt) save
-            warnings.append("Working base strategie: werkende save als basis, alleen sim-data van nieuwere")
-
-            # Start with ALL resources from older (working) save
-            for key, resource in self.older_file.resources.items():
-                merged.resources[key] = resource
-                resources_from_older_count += 1
-
-            # Now ONLY update sim-related resources from newer save
-            sim_updates = 0
-            for key, resource in self.newer_file.resources.items():
-                type_id = key[0]
-                # Only use newer version for sim-related types
-                if type_id in self.SIM_RELATED_TYPES:
-                    merged.resources[key] = resource
-                    resources_from_newer_count += 1
-                    resources_from_older_count -= 1  # We're replacing
-                    sim_updates += 1
-
-            warnings.append(f"Updated {sim_updates} sim-gerelateerde resources van nieuwere save")
-
-            # Add any new resources from newer that don't exist in older
-            for key in self._comparison['only_in_file1']:
-                if key not in merged.resources:
-                    merged.resources[key] = self.newer_file.resources[key]
-                    resources_from_newer_count += 1
-
-            # Skip the normal resource loop for WORKING_BASE
-            self._report_progress("Opslaan van samengevoegd bestand...", 80)
+        # Each strategy fills merged.resources and returns where they came from
+        build = getattr(self, self._STRATEGY_HANDLERS.get(strategy, '_build_newer_base'))
+        resources_from_newer_count, resources_from_older_count = build(
+            merged, warnings, resources_to_add, resources_from_older
+        )
 
-            try:
-                merged.save(output_path)
-            except Exception as e:
-                errors.append(f"Fout bij opslaan: {str(e)}")
-                return MergeResult(
-                    success=False,
-                    output_file=None,
-                    resources_from_newer=resources_from_newer_count,
-                    resources_from_older=resources_from_older_count,
-                    resources_total=len(merged.resources),
-                    errors=errors,
-                    warnings=warnings
-                )
-
-            self._report_progress("Samenvoegen voltooid!", 100)
+        self._report_progress("Opslaan van samengevoegd bestand...", 80)
 
+        try:
+            backup_made = self._save_merged(merged, output_path, backup_path)
+        except Exception as e:
+            errors.append(f"Fout bij opslaan: {str(e)}")
             return MergeResult(
-                success=True,
-                output_file=output_path,
+                success=False,
+                output_file=None,
                 resources_from_newer=resources_from_newer_count,
                 resources_from_older=resources_from_older_count,
                 resources_total=len(merged.resources),
@@ -453,25 +524,120 @@ class Sims4SaveMerger:
                 warnings=warnings
             )
 
-        for key, resource in self.newer_file.resources.items():
-            # Check if we should use older version for conflicts
-            use_older = False
+        if backup_made is not None:
+            warnings.insert(0, f"Backup gemaakt: {backup_made}")
+
+        self._report_progress("Samenvoegen voltooid!", 100)
+
+        return MergeResult(
+            success=True,
+            output_file=output_path,
+            resources_from_newer=resources_from_newer_count,
+            resources_from_older=resources_from_older_count,
+            resources_total=len(merged.resources),
+            errors=errors,
+            warnings=warnings
+        )
+
+    def _build_smart_merge(
+        self,
+        merged: DBPFFile,
+        warnings: List[str],
+        resources_to_add: Optional[Set[Tuple[int, int, int]]],
+        resources_from_older: Optional[Set[Tuple[int, int, int]]]
+    ) -> Tuple[int, int]:
+        """Newer base, taking empty/corrupted resources from the older save"""
+        use_older_keys = self._detect_empty_resources()
+        if use_older_keys:
+            warnings.append(f"Smart merge: {len(use_older_keys)} resources worden uit oudere save genomen (lege/corrupte detectie)")
+
+        return self._build_newer_base(merged, warnings, resources_to_add, resources_from_older,
+                                      use_older_keys)
+
+    def _build_prefer_larger(
+        self,
+        merged: DBPFFile,
+        warnings: List[str],
+        resources_to_add: Optional[Set[Tuple[int, int, int]]],
+        resources_from_older: Optional[Set[Tuple[int, int, int]]]
+    ) -> Tuple[int, int]:
+        """Newer base, taking the older version whenever it is bigger"""
+        use_older_keys = self._get_larger_resources()
+        if use_older_keys:
+            warnings.append(f"Prefer larger: {len(use_older_keys)} resources worden uit oudere save genomen (grotere versie)")
+
+        return self._build_newer_base(merged, warnings, resources_to_add, resources_from_older,
+                                      use_older_keys)
+
+    def _build_working_base(
+        self,
+        merged: DBPFFile,
+        warnings: List[str],
+        resources_to_add: Optional[Set[Tuple[int, int, int]]],
+        resources_from_older: Optional[Set[Tuple[int, int, int]]]
+    ) -> Tuple[int, int]:
+        """
+        Older (working) save as base, only updating sim data from newer
+
+        resources_to_add and resources_from_older don't apply to this strategy.
+        """
+        warnings.append("Working base strategie: werkende save als basis, alleen sim-data van nieuwere")
+
+        # Start with ALL resources from older (working) save
+        merged_resources = dict(self.older_file.resources)
+        merged.resources = merged_resources
+        newer_resources = self.newer_file.resources
+
+        # Now ONLY update sim-related resources from newer save
+        sim_types = self.SIM_RELATED_TYPES
+        sim_resources = [(key, resource) for key, resource in newer_resources.items()
+                         if key[0] in sim_types]
+        merged_resources.update(sim_resources)
+        sim_updates = len(sim_resources)
 
-            # Explicit override
-            if resources_from_older and key in resources_from_older:
-                use_older = True
+        warnings.append(f"Updated {sim_updates} sim-gerelateerde resources van nieuwere save")
 
-            # Strategy-based selection
-            if key in use_older_keys:
-                use_older = True
+        # Add any new resources from newer that don't exist in older
+        new_keys = [key for key in self._comparison['only_in_file1']
+                    if key not in merged_resources]
+        merged_resources.update((key, newer_resources[key]) for key in new_keys)
 
-            if use_older and key in self.older_file.resources:
-                merged.resources[key] = self.older_file.resources[key]
-                resources_from_older_count += 1
-                continue
+        # Every sim update counts as replacing an older resource
+        resources_from_older_count = len(self.older_file.resources) - sim_updates
+        resources_from_newer_count = sim_updates + len(new_keys)
+        return resources_from_newer_count, resources_from_older_count
+
+    def _build_newer_base(
+        self,
+        merged: DBPFFile,
+        warnings: List[str],
+        resources_to_add: Optional[Set[Tuple[int, int, int]]],
+        resources_from_older: Optional[Set[Tuple[int, int, int]]],
+        use_older_keys: Set[Tuple[int, int, int]] = frozenset()
+    ) -> Tuple[int, int]:
+        """
+        Newer save as base, adding missing resources from the older save
+
+        Args:
+            use_older_keys: Keys the strategy itself takes from the older save
+        """
+        older_resources = self.older_file.resources
 
-            merged.resources[key] = resource
-            resources_from_newer_count += 1
+        # Copy the newer save in one go (keeping its order), then swap in the
+        # older version for keys that should come from the older save
+        merged_resources = dict(self.newer_file.resources)
+        merged.resources = merged_resources
+
+        override = set(use_older_keys)
+        if resources_from_older:
+            override |= resources_from_older
+        if override:
+            override &= merged_resources.keys()
+            override &= older_resources.keys()
+            merged_resources.update((key, older_resources[key]) for key in override)
+
+        resources_from_older_count = len(override)
+        resources_from_newer_count = len(merged_resources) - len(override)
 
         self._report_progress("Toevoegen van ontbrekende resources...", 50)
 
@@ -483,39 +649,80 @@ class Sims4SaveMerger:
             # Add all missing resources
             to_add = self._comparison['only_in_file2']
 
-        # Add missing resources from older save
-        for key in to_add:
-            if key in self.older_file.resources:
-                merged.resources[key] = self.older_file.resources[key]
-                resources_from_older_count += 1
+        # Add missing resources from older save. only_in_file2 is taken from
+        # the older save's keys, so every key in to_add is present there.
+        # They are added in on-disk order rather than set order, so saving
+        # reads (and decompresses) the source buffer front to back.
+        add_order = sorted(to_add, key=lambda key: older_resources[key].offset)
+        merged_resources.update((key, older_resources[key]) for key in add_order)
+        resources_from_older_count += len(to_add)
 
-        self._report_progress("Opslaan van samengevoegd bestand...", 80)
+        return resources_from_newer_count, resources_from_older_count
 
-        try:
-            merged.save(output_path)
-        except Exception as e:
-            errors.append(f"Fout bij opslaan: {str(e)}")
-            return MergeResult(
-                success=False,
-                output_file=None,
-                resources_from_newer=resources_from_newer_count,
-                resources_from_older=resources_from_older_count,
-                resources_total=len(merged.resources),
-                errors=errors,
-                warnings=warnings
-            )
+    def _throttled_progress(self, message: str, base: int, span: int) -> Callable[[int, int], None]:
+        """
+        Make a progress(done, total) callback mapped onto base..base+span
 
-        self._report_progress("Samenvoegen voltooid!", 100)
+        Only changes in the whole percentage are passed on (base itself is
+        assumed to be reported already), so callers can report as often as
+        they like.
+        """
+        last_percent = base
 
-        return MergeResult(
-            success=True,
-            output_file=output_path,
-            resources_from_newer=resources_from_newer_count,
-            resources_from_older=resources_from_older_count,
-            resources_total=len(merged.resources),
-            errors=errors,
-            warnings=warnings
-        )
+        def progress(done: int, total: int):
+            nonlocal last_percent
+            percent = base + span * done // total
+            if percent != last_percent:
+                last_percent = percent
+                self._report_progress(message, percent)
+
+        return progress
+
+    def _save_merged(
+        self,
+        merged: DBPFFile,
+        output_path: Path,
+        backup_path: Optional[Path]
+    ) -> Optional[Path]:
+        """
+        Write the merged file, keeping any existing output as backup_path
+
+        The old output is hard-linked to backup_path (renamed where hard links
+        aren't supported), then merged.save() replaces output_path in one step
+        once the new file is complete. An existing backup is never overwritten,
+        and if saving fails the backup is undone and the old output kept.
+
+        Returns:
+            The backup that was made, or None
+        """
+        # Saving can take a while on big saves, so report its progress
+        progress = None
+        if self.progress_callback:
+            progress = self._throttled_progress("Opslaan van samengevoegd bestand...", 80, 15)
+
+        renamed = False
+        if backup_path is not None:
+            try:
+                os.link(output_path, backup_path)
+            except FileExistsError:
+                raise
+            except OSError:
+                # No hard links on this file system (e.g. FAT32/exFAT)
+                if backup_path.exists():
+                    raise FileExistsError(f"Backup bestaat al: {backup_path}")
+                os.rename(output_path, backup_path)
+                renamed = True
+
+        try:
+            merged.save(output_path, progress=progress)
+        except BaseException:
+            if renamed:
+                os.replace(backup_path, output_path)
+            elif backup_path is not None:
+                os.unlink(backup_path)
+            raise
+
+        return backup_path
 
     def quick_merge(
         self,
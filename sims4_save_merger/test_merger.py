@@ -14,7 +14,7 @@ from pathlib import Path
 # Add parent to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sims4_save_merger.dbpf_parser import DBPFFile, DBPFHeader, IndexEntry, Resource
+from sims4_save_merger.dbpf_parser import DBPFFile, DBPFHeader, IndexEntry
 from sims4_save_merger.merger import Sims4SaveMerger, MergeStrategy
 
 
@@ -26,8 +26,7 @@ def create_test_dbpf(filepath: Path, resources: dict):
         filepath: Output path
         resources: Dict of {(type, group, instance): bytes_data}
     """
-    dbpf = DBPFFile()
-    dbpf.header = DBPFHeader(
+    header = DBPFHeader(
         magic=b'DBPF',
         major_version=2,
         minor_version=1,
@@ -36,8 +35,8 @@ def create_test_dbpf(filepath: Path, resources: dict):
         index_size=0
     )
 
-    for key, data in resources.items():
-        entry = IndexEntry(
+    entries = [
+        IndexEntry(
             type_id=key[0],
             group_id=key[1],
             instance_id=key[2],
@@ -46,7 +45,9 @@ def create_test_dbpf(filepath: Path, resources: dict):
             mem_size=len(data),
             compressed=False
         )
-        dbpf.resources[key] = Resource(entry=entry, data=data)
+        for key, data in resources.items()
+    ]
+    dbpf = DBPFFile.from_entries(header, entries, list(resources.values()))
 
     dbpf.save(filepath)
 
@@ -202,6 +203,128 @@ def test_comparison():
         return True
 
 
+def test_backup():
+    """Test backup of an existing output, after a successful and a failed save"""
+    print("\n" + "=" * 60)
+    print("TEST 4: Backup van bestaande uitvoer")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp = Path(tmpdir)
+        newer_file = tmp / "newer.save"
+        older_file = tmp / "older.save"
+        output_file = tmp / "merged.save"
+
+        create_test_dbpf(newer_file, {
+            (0x11111111, 0x00000000, 0x0000000000000001): b"Sim data (newer)",
+        })
+        create_test_dbpf(older_file, {
+            (0x44444444, 0x00000000, 0x0000000000000004): b"Building A",
+        })
+        output_file.write_bytes(b"oude uitvoer")
+
+        merger = Sims4SaveMerger()
+        merger.load_files(newer_file, older_file)
+
+        # Successful merge: the old output is kept as backup
+        result = merger.merge(output_file)
+        assert result.success, f"Merge mislukt: {result.errors}"
+        backups = sorted(tmp.glob("merged.backup_*.save"))
+        assert len(backups) == 1, f"Verwacht 1 backup, kreeg {len(backups)}"
+        assert backups[0].read_bytes() == b"oude uitvoer", "Backup heeft verkeerde inhoud"
+        assert f"Backup gemaakt: {backups[0]}" in result.warnings, "Backup melding ontbreekt"
+        print(f"  Backup na geslaagde merge: {backups[0].name}")
+
+        # Failed save: output and earlier backup stay, nothing is left over
+        merged_bytes = output_file.read_bytes()
+        files_before = sorted(tmp.iterdir())
+
+        original_save = DBPFFile.save
+
+        def failing_save(self, filepath, *args, **kwargs):
+            raise OSError("schijf vol")
+
+        DBPFFile.save = failing_save
+        try:
+            result = merger.merge(output_file)
+        finally:
+            DBPFFile.save = original_save
+
+        assert not result.success, "Merge had moeten mislukken"
+        assert not any(w.startswith("Backup gemaakt") for w in result.warnings), \
+            "Backup gemeld terwijl opslaan mislukte"
+        assert output_file.read_bytes() == merged_bytes, "Uitvoer is gewijzigd"
+        assert sorted(tmp.iterdir()) == files_before, "Er zijn bestanden achtergebleven"
+        print("  Mislukt opslaan laat geen bestanden achter")
+
+        print("\n✅ Test geslaagd!")
+        return True
+
+
+def test_deduplicate():
+    """Test saving with deduplicate=True and reading the file back"""
+    print("\n" + "=" * 60)
+    print("TEST 5: Opslaan met deduplicatie")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        test_file = Path(tmpdir) / "dedup.save"
+
+        shared = b"Gedeelde data" * 10
+        resources = {
+            (0x11111111, 0x00000000, 0x0000000000000001): shared,
+            (0x22222222, 0x00000000, 0x0000000000000002): b"Unieke data",
+            (0x33333333, 0x00000000, 0x0000000000000003): shared,
+        }
+
+        header = DBPFHeader(
+            magic=b'DBPF',
+            major_version=2,
+            minor_version=1,
+            index_entry_count=len(resources),
+            index_offset=0,
+            index_size=0
+        )
+        entries = [
+            IndexEntry(
+                type_id=key[0],
+                group_id=key[1],
+                instance_id=key[2],
+                offset=0,
+                file_size=len(data),
+                mem_size=len(data),
+                compressed=False
+            )
+            for key, data in resources.items()
+        ]
+        DBPFFile.from_entries(header, entries, list(resources.values())).save(
+            test_file, deduplicate=True
+        )
+
+        dbpf = DBPFFile(test_file)
+
+        assert set(dbpf.resources) == set(resources), "Keys verschillen na inlezen"
+        for key, expected_data in resources.items():
+            assert dbpf.resources[key].data == expected_data, f"Data van {key} verschilt"
+
+        key_1 = (0x11111111, 0x00000000, 0x0000000000000001)
+        key_2 = (0x22222222, 0x00000000, 0x0000000000000002)
+        key_3 = (0x33333333, 0x00000000, 0x0000000000000003)
+        offset_1 = dbpf.resources[key_1].entry.offset
+        assert dbpf.resources[key_3].entry.offset == offset_1, "Dubbele data deelt geen offset"
+        assert dbpf.resources[key_2].entry.offset != offset_1, "Unieke data deelt een offset"
+
+        # Only one copy of the shared data is stored
+        expected_size = 96 + len(shared) + len(b"Unieke data") + 4 + 28 * len(resources)
+        assert test_file.stat().st_size == expected_size, \
+            f"Verwacht {expected_size} bytes, kreeg {test_file.stat().st_size}"
+
+        print(f"  Resources: {len(dbpf.resources)}, gedeelde offset: {offset_1}")
+
+        print("\n✅ Test geslaagd!")
+        return True
+
+
 def run_all_tests():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -212,6 +335,8 @@ def run_all_tests():
         test_basic_functionality,
         test_merge_functionality,
         test_comparison,
+        test_backup,
+        test_deduplicate,
     ]
 
     passed = 0
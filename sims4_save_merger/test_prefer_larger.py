@@ -36,12 +36,8 @@ def test():
     output_smart = Path("sims4_save_merger/test_smart.save")
     result_smart = merger.merge(output_smart, strategy=MergeStrategy.SMART_MERGE)
 
-    # Reload for prefer larger
-    merger2 = Sims4SaveMerger()
-    merger2.load_files(
-        Path("sims4_save_merger/Slot_00000002.save"),
-        Path("sims4_save_merger/Slot_00000012.save")
-    )
+    # Same saves for prefer larger, no need to load them again
+    merger2 = merger.clone_for_strategy()
 
     output_larger = Path("sims4_save_merger/test_prefer_larger.save")
     result_larger = merger2.merge(output_larger, strategy=MergeStrategy.PREFER_LARGER)
@@ -60,8 +56,8 @@ def test():
     smart_file = DBPFFile(output_smart)
     larger_file = DBPFFile(output_larger)
 
-    smart_data = sum(len(r.data) for r in smart_file.resources.values())
-    larger_data = sum(len(r.data) for r in larger_file.resources.values())
+    smart_data = sum(r.size for r in smart_file.resources.values())
+    larger_data = sum(r.size for r in larger_file.resources.values())
 
     print(f"\n📊 DATA VERGELIJKING:")
     print(f"   Smart merge data:    {smart_data / 1024 / 1024:.2f} MB")
@@ -59,7 +59,7 @@ def test_smart_merge():
     # Load merged file and check size
     print(f"\n📁 Verificatie merged bestand:")
     merged = DBPFFile(output_path)
-    merged_total_size = sum(len(r.data) for r in merged.resources.values())
+    merged_total_size = sum(r.size for r in merged.resources.values())
     print(f"   Resources: {len(merged.resources)}")
     print(f"   Data grootte: {merged_total_size/1024/1024:.2f} MB")
 
@@ -68,7 +68,7 @@ def test_smart_merge():
 
     # Calculate expected size
     older_only_keys = set(merger.older_file.resources.keys()) - set(merger.newer_file.resources.keys())
-    expected_from_older = sum(len(merger.older_file.resources[k].data) for k in older_only_keys)
+    expected_from_older = sum(merger.older_file.resources[k].size for k in older_only_keys)
 
     # Plus smart merge restored data
     smart_restored = sum(old.size - new.size for new, old in candidates)
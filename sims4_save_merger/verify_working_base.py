@@ -7,6 +7,7 @@ import sys
 sys.path.insert(0, '/home/user/De-Es-9b-Frans-kerst-2025')
 
 from sims4_save_merger.dbpf_parser import DBPFFile
+from sims4_save_merger.merger import Sims4SaveMerger
 from pathlib import Path
 
 def verify():
@@ -35,18 +36,21 @@ def verify():
     print("\n3. GEBOUW DATA (Type 0x00000006) - KRITISCH")
     print("-" * 40)
 
-    working_buildings = {k: v for k, v in working.resources.items() if k[0] == 0x00000006}
-    new_merge_buildings = {k: v for k, v in new_merge.resources.items() if k[0] == 0x00000006}
-    old_merge_buildings = {k: v for k, v in old_merge.resources.items() if k[0] == 0x00000006}
+    # Bucket by type once; the sim check below reuses the new merge groups
+    new_merge_types = new_merge.resources_by_type()
+
+    working_buildings = working.resources_by_type().get(0x00000006, {})
+    new_merge_buildings = new_merge_types.get(0x00000006, {})
+    old_merge_buildings = old_merge.resources_by_type().get(0x00000006, {})
 
     # Check new merge
     new_matches = sum(1 for k in working_buildings if k in new_merge_buildings and
-                      new_merge_buildings[k].data == working_buildings[k].data)
+                      new_merge_buildings[k].same_data(working_buildings[k]))
     new_differs = len(working_buildings) - new_matches
 
     # Check old merge
     old_matches = sum(1 for k in working_buildings if k in old_merge_buildings and
-                      old_merge_buildings[k].data == working_buildings[k].data)
+                      old_merge_buildings[k].same_data(working_buildings[k]))
     old_differs = len(working_buildings) - old_matches
 
     print(f"   Werkende save heeft: {len(working_buildings)} gebouw resources")
@@ -67,14 +71,13 @@ def verify():
     print("\n4. SIM DATA UPDATES")
     print("-" * 40)
 
-    sim_types = {0xC0DB5AE7, 0x0C772E27, 0x3BD45407, 0x0000000D, 0x0000000F,
-                 0xB61DE6B4, 0x00000014, 0x00000015}
-
-    new_merge_sim = {k: v for k, v in new_merge.resources.items() if k[0] in sim_types}
-    corrupt_sim = {k: v for k, v in corrupt.resources.items() if k[0] in sim_types}
+    sim_types = Sims4SaveMerger.SIM_RELATED_TYPES
+    corrupt_types = corrupt.resources_by_type()
+    new_merge_sim = {k: v for t in sim_types for k, v in new_merge_types.get(t, {}).items()}
+    corrupt_sim = {k: v for t in sim_types for k, v in corrupt_types.get(t, {}).items()}
 
     from_corrupt = sum(1 for k in new_merge_sim if k in corrupt_sim and
-                       new_merge_sim[k].data == corrupt_sim[k].data)
+                       new_merge_sim[k].same_data(corrupt_sim[k]))
 
     print(f"   Sim-gerelateerde resources in merge: {len(new_merge_sim)}")
     print(f"   Daarvan met nieuwere sim-data:       {from_corrupt}")